@@ -5,15 +5,25 @@ Generate tag_values.go with all DICOM tag definitions.
 This script fetches DICOM tag definitions from the innolitics JSON representation
 and generates a Go file with exported variables and a TagDict map.
 """
-import json
 import logging
+import os
 import urllib.request
-from typing import IO, NamedTuple, List
+from operator import itemgetter
+from pathlib import Path
+from typing import IO, Dict, NamedTuple, List, Tuple
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 logging.basicConfig(level=logging.DEBUG)
 
 INNOLITICS_VERSION_HASH = "7f4749d09ed3ef2fa70637d376d423a4b13523cd"  # rev2024b
 
+# Downloaded innolitics sources are cached here, keyed by version hash.
+CACHE_DIR = Path(__file__).parent / ".cache"
+
 INNOLITICS_CREDITS = f'''// This file's contents are derived from the innolitics json representation of the dicom standard.
 // The innolitics source is licensed as follows:
 // https://github.com/innolitics/dicom-standard/blob/{INNOLITICS_VERSION_HASH}/LICENSE.txt
@@ -48,29 +58,97 @@ Tag = NamedTuple('Tag', [
     ('retired', bool)])
 
 
+# Mapping from VR strings to Go VR constant names.
+_VR_MAP = {
+    "AE": "vr.ApplicationEntity",
+    "AS": "vr.AgeString",
+    "AT": "vr.AttributeTag",
+    "CS": "vr.CodeString",
+    "DA": "vr.Date",
+    "DS": "vr.DecimalString",
+    "DT": "vr.DateTime",
+    "FD": "vr.FloatingPointDouble",
+    "FL": "vr.FloatingPointSingle",
+    "IS": "vr.IntegerString",
+    "LO": "vr.LongString",
+    "LT": "vr.LongText",
+    "OB": "vr.OtherByte",
+    "OD": "vr.OtherDouble",
+    "OF": "vr.OtherFloat",
+    "OL": "vr.OtherLong",
+    "OV": "vr.OtherVeryLong",
+    "OW": "vr.OtherWord",
+    "PN": "vr.PersonName",
+    "SH": "vr.ShortString",
+    "SL": "vr.SignedLong",
+    "SQ": "vr.SequenceOfItems",
+    "SS": "vr.SignedShort",
+    "ST": "vr.ShortText",
+    "SV": "vr.SignedVeryLong",
+    "TM": "vr.Time",
+    "UC": "vr.UnlimitedCharacters",
+    "UI": "vr.UniqueIdentifier",
+    "UL": "vr.UnsignedLong",
+    "UN": "vr.Unknown",
+    "UR": "vr.UniversalResourceIdentifier",
+    "US": "vr.UnsignedShort",
+    "UT": "vr.UnlimitedText",
+    "UV": "vr.UnsignedVeryLong",
+    # Special case for Item tags
+    "NA": "vr.Unknown",  # Item-related tags use UN as VR
+}
+_VR_DEFAULT = "vr.Unknown"
+
+# Go VR list literals keyed by VR tuple; most tags share a handful of combinations.
+_VR_LIST_CACHE: Dict[Tuple[str, ...], str] = {}
+
+# Template for a single TagDict entry line.
+_ENTRY_TMPL = '\t%s: Info{Tag: %s, VRs: []vr.VR{%s}, Name: "%s", Keyword: "%s", VM: "%s", Retired: %s},\n'
+
+
 def read_tags_from_innolitics(version_hash: str) -> List[Tag]:
     """Fetch DICOM tags from innolitics GitHub repository."""
-    logging.info(f"Fetching tags from innolitics (version {version_hash[:8]})")
-    response = urllib.request.urlopen(
-        f"https://raw.githubusercontent.com/innolitics/dicom-standard/{version_hash}/standard/attributes.json"
-    )
-    attrs = json.loads(response.read().decode())
+    # The download is pinned to a commit hash, so a cached copy never goes stale.
+    cache_path = CACHE_DIR / f"innolitics-{version_hash}.json"
+    if cache_path.exists():
+        logging.info(f"Reading cached tags from {cache_path}")
+        data = cache_path.read_bytes()
+    else:
+        logging.info(f"Fetching tags from innolitics (version {version_hash[:8]})")
+        with urllib.request.urlopen(
+            f"https://raw.githubusercontent.com/innolitics/dicom-standard/{version_hash}/standard/attributes.json"
+        ) as response:
+            data = response.read()
+        # Write a sibling .tmp file and move it into place, so an interrupted
+        # run never leaves a truncated cache file behind
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_path)
+
+    # Both orjson and json accept bytes, avoiding a full-buffer decode
+    attrs = _json.loads(data)
     allowed_vrs_separator = " or "
-
-    tags = [
-        Tag(
-            # The id field should always follow format "ggggeeee", so this should be safe.
-            group=int(resolvable_tag_id[:4], 16),
-            elem=int(resolvable_tag_id[4:], 16),
+    get_fields = itemgetter("id", "valueRepresentation", "name", "valueMultiplicity", "keyword", "retired")
+
+    tags = []
+    append_tag = tags.append
+    for e in attrs:
+        tag_id, vr_str, name, vm, keyword, retired = get_fields(e)
+        if not keyword:
+            continue
+        # The id field should always follow format "ggggeeee", so this should be safe.
+        tag_value = int(tag_id.replace("x", "0"), 16)
+        group = tag_value >> 16
+        append_tag(Tag(
+            group=group,
+            elem=tag_value & 0xFFFF,
             # To understand this ternary expression, see: https://dicom.nema.org/medical/dicom/2024a/output/html/part06.html#note_6_2.
-            vr=(e["valueRepresentation"] if resolvable_tag_id[:4].lower() != 'fffe' else "NA").split(allowed_vrs_separator),
-            name=e["name"],
-            vm=e["valueMultiplicity"],
-            keyword=e["keyword"],
-            retired=e["retired"] == "Y")
-        for e in attrs
-        if (resolvable_tag_id := e["id"].replace("x", "0")) and len(e["keyword"]) > 0
-    ]
+            vr=(vr_str if group != 0xFFFE else "NA").split(allowed_vrs_separator),
+            name=name,
+            vm=vm,
+            keyword=keyword,
+            retired=retired == "Y"))
 
     logging.info(f"Found {len(tags)} tags")
     return tags
@@ -78,60 +156,35 @@ def read_tags_from_innolitics(version_hash: str) -> List[Tag]:
 
 def vr_string_to_go_const(vr: str) -> str:
     """Convert VR string to Go VR constant name."""
-    vr_map = {
-        "AE": "vr.ApplicationEntity",
-        "AS": "vr.AgeString",
-        "AT": "vr.AttributeTag",
-        "CS": "vr.CodeString",
-        "DA": "vr.Date",
-        "DS": "vr.DecimalString",
-        "DT": "vr.DateTime",
-        "FD": "vr.FloatingPointDouble",
-        "FL": "vr.FloatingPointSingle",
-        "IS": "vr.IntegerString",
-        "LO": "vr.LongString",
-        "LT": "vr.LongText",
-        "OB": "vr.OtherByte",
-        "OD": "vr.OtherDouble",
-        "OF": "vr.OtherFloat",
-        "OL": "vr.OtherLong",
-        "OV": "vr.OtherVeryLong",
-        "OW": "vr.OtherWord",
-        "PN": "vr.PersonName",
-        "SH": "vr.ShortString",
-        "SL": "vr.SignedLong",
-        "SQ": "vr.SequenceOfItems",
-        "SS": "vr.SignedShort",
-        "ST": "vr.ShortText",
-        "SV": "vr.SignedVeryLong",
-        "TM": "vr.Time",
-        "UC": "vr.UnlimitedCharacters",
-        "UI": "vr.UniqueIdentifier",
-        "UL": "vr.UnsignedLong",
-        "UN": "vr.Unknown",
-        "UR": "vr.UniversalResourceIdentifier",
-        "US": "vr.UnsignedShort",
-        "UT": "vr.UnlimitedText",
-        "UV": "vr.UnsignedVeryLong",
-        # Special case for Item tags
-        "NA": "vr.Unknown",  # Item-related tags use UN as VR
-    }
-    return vr_map.get(vr, "vr.Unknown")
+    return _VR_MAP.get(vr, _VR_DEFAULT)
+
+
+def vr_list_to_go(vrs: Tuple[str, ...]) -> str:
+    """Convert a tuple of VR strings to a comma-separated list of Go VR constants."""
+    vr_list = _VR_LIST_CACHE.get(vrs)
+    if vr_list is None:
+        vr_list = _VR_LIST_CACHE[vrs] = ", ".join(vr_string_to_go_const(v) for v in vrs)
+    return vr_list
 
 
 def tag_dict_entry(t: Tag) -> str:
-    """Generate a TagDict entry for a single tag."""
-    start_indent = '\t'
-    vr_list = ", ".join(vr_string_to_go_const(v) for v in t.vr)
-    return f'{start_indent}{t.keyword}: Info{{Tag: {t.keyword}, VRs: []vr.VR{{{vr_list}}}, Name: "{t.name}", Keyword: "{t.keyword}", VM: "{t.vm}", Retired: {str(t.retired).lower()}}},'
+    """Generate a newline-terminated TagDict entry for a single tag."""
+    keyword = t.keyword
+    return _ENTRY_TMPL % (
+        keyword,
+        keyword,
+        vr_list_to_go(tuple(t.vr)),
+        t.name,
+        keyword,
+        t.vm,
+        "true" if t.retired else "false")
 
 
 def generate(out: IO[str]):
     """Generate the complete tag_values.go file."""
     tags = read_tags_from_innolitics(INNOLITICS_VERSION_HASH)
-    new_line = chr(10)
 
-    print(f'''// AUTO-GENERATED from generate_tag_values.py. DO NOT EDIT.
+    out.write(f'''// AUTO-GENERATED from generate_tag_values.py. DO NOT EDIT.
 {INNOLITICS_CREDITS}
 package tag
 
@@ -140,18 +193,20 @@ import "github.com/harrison-ai/go-radx/dicom/vr"
 // Standard DICOM tags as exported variables for convenient access.
 // These are all tags defined in the DICOM standard Part 6, Chapter 6.
 // https://dicom.nema.org/medical/dicom/current/output/html/part06.html#chapter_6
-{new_line.join(f"var {t.keyword} = New(0x{t.group:04x}, 0x{t.elem:04x})" for t in tags)}
-
+''')
+    out.writelines(f"var {t.keyword} = New(0x{t.group:04x}, 0x{t.elem:04x})\n" for t in tags)
+    out.write('''
 // TagDict is a map of all standard DICOM tags to their metadata.
 // It provides VR information, names, keywords, value multiplicity, and retirement status.
-var TagDict = map[Tag]Info{{
-{new_line.join(tag_dict_entry(t) for t in tags)}
-}}''', file=out)
+var TagDict = map[Tag]Info{
+''')
+    out.writelines(tag_dict_entry(t) for t in tags)
+    out.write("}\n")
 
 
 def main():
     """Main entry point."""
-    with open("tag_values.go", "w") as out:
+    with open("tag_values.go", "w", buffering=1 << 20) as out:
         generate(out)
     logging.info("Successfully generated tag_values.go")
 
@@ -15,7 +15,7 @@ import (
 	"unicode"
 )
 
-// Import the uid package to access uidMap
+// Import the uid package to access uidTable
 // Note: This requires the package to be built first
 
 func main() {
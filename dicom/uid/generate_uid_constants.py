@@ -8,10 +8,40 @@ This script reads uid_values.go and generates two new files:
 """
 
 import re
+import string
 import sys
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Tuple
 
+# Punctuation is replaced with spaces so it splits words; '_' is a word character
+_PUNCT_TRANS = str.maketrans({c: ' ' for c in string.punctuation if c != '_'})
+
+# Fallback for names with non-ASCII symbols, which _PUNCT_TRANS does not cover
+_NON_WORD_RE = re.compile(r'[^\w\s]+')
+
+# Special acronyms that should be uppercase
+_ACRONYMS = frozenset({
+    'vr', 'uid', 'sop', 'ct', 'mr', 'us', 'pet', 'nm', 'xa', 'rf',
+    'dx', 'mg', 'io', 'px', 'gm', 'sm', 'au', 'hd', 'sr', 'ko', 'pr',
+    'rt', 'rwv', 'seg', 'fid', 'reg', 'jpeg', 'rle', 'mpeg', 'smpte',
+    'dicom', 'hl7', 'ihe', 'iso', 'qr', 'mpps', 'gp', 'pps', 'pdf',
+    'cda', 'stl', 'mtl', 'obj', 'iv', 'uv', 'roi', 'rtss', 'dvh',
+    'mwl', 'ups', 'nud', 'fda', 'css', 'html', 'xml', 'json', 'uri'
+})
+
+# Ends the doc comment of a retired UID constant
+_RETIRED_NOTICE = ' (RETIRED)\n\t//\n\t// Deprecated: This UID has been retired from the DICOM standard.\n'
+
+# (uid, name, retired)
+UIDEntry = Tuple[str, str, bool]
+
+# Format: {UID: "UID", Name: "NAME", Type: TypeXXX, Info: "INFO", Retired: bool},
+_UID_ENTRY_RE = re.compile(
+    rb'\{\s*UID:\s*"([^"]+)",\s*Name:\s*"([^"]*)",\s*Type:\s*(Type\w+),'
+    rb'\s*Info:\s*"[^"]*",\s*Retired:\s*(true|false)\s*\}'
+)
+
 
 def to_go_constant_name(name: str) -> str:
     """
@@ -20,25 +50,18 @@ def to_go_constant_name(name: str) -> str:
     Example: "Implicit VR Little Endian" -> "ImplicitVRLittleEndian"
     """
     # Remove special characters and replace with spaces
-    name = re.sub(r'[^\w\s]+', ' ', name)
+    if name.isascii():
+        name = name.translate(_PUNCT_TRANS)
+    else:
+        name = _NON_WORD_RE.sub(' ', name)
 
     # Split into words
     words = name.split()
 
-    # Special acronyms that should be uppercase
-    acronyms = {
-        'vr', 'uid', 'sop', 'ct', 'mr', 'us', 'pet', 'nm', 'xa', 'rf',
-        'dx', 'mg', 'io', 'px', 'gm', 'sm', 'au', 'hd', 'sr', 'ko', 'pr',
-        'rt', 'rwv', 'seg', 'fid', 'reg', 'jpeg', 'rle', 'mpeg', 'smpte',
-        'dicom', 'hl7', 'ihe', 'iso', 'qr', 'mpps', 'gp', 'pps', 'pdf',
-        'cda', 'stl', 'mtl', 'obj', 'iv', 'uv', 'roi', 'rtss', 'dvh',
-        'mwl', 'ups', 'nud', 'fda', 'css', 'html', 'xml', 'json', 'uri'
-    }
-
     result = []
     for word in words:
         word_lower = word.lower()
-        if word_lower in acronyms:
+        if word_lower in _ACRONYMS:
             result.append(word.upper())
         elif word_lower.isdigit():
             result.append(word)
@@ -56,173 +79,124 @@ def to_go_constant_name(name: str) -> str:
     return const_name
 
 
-def parse_uid_map(uid_values_path: Path) -> List[Tuple[str, str, str, bool]]:
+def parse_uid_table(uid_values_path: Path) -> Tuple[List[UIDEntry], List[UIDEntry]]:
     """
-    Parse uid_values.go and extract all UIDs from uidMap.
-
-    Returns: List of (uid, name, type, retired) tuples
-    """
-    content = uid_values_path.read_text()
-
-    # Find the uidMap declaration - match until the closing brace
-    # Need to be careful with nested braces
-    uid_map_start = content.find('var uidMap = map[string]Info{')
-    if uid_map_start == -1:
-        raise ValueError("Could not find uidMap in uid_values.go")
-
-    # Find the closing brace by counting braces
-    brace_count = 0
-    start_pos = uid_map_start + len('var uidMap = map[string]Info')
-    for i, char in enumerate(content[start_pos:], start=start_pos):
-        if char == '{':
-            brace_count += 1
-        elif char == '}':
-            brace_count -= 1
-            if brace_count == 0:
-                uid_map_content = content[uid_map_start:i+1]
-                break
-    else:
-        raise ValueError("Could not find closing brace for uidMap")
+    Parse uid_values.go and extract Transfer Syntax and SOP Class UIDs from uidTable.
 
-    # Parse each UID entry
-    # Format: "UID": {UID: "UID", Name: "NAME", Type: TypeXXX, Info: "INFO", Retired: bool},
-    pattern = r'"([^"]+)":\s*\{\s*UID:\s*"[^"]*",\s*Name:\s*"([^"]*)",\s*Type:\s*(Type\w+),\s*Info:\s*"[^"]*",\s*Retired:\s*(true|false)\s*\}'
+    UIDs with empty names are skipped since they cannot be named as constants.
 
-    uids = []
-    for match in re.finditer(pattern, uid_map_content):
-        uid = match.group(1)
-        name = match.group(2)
-        uid_type = match.group(3).strip()
-        retired = match.group(4) == 'true'
-        uids.append((uid, name, uid_type, retired))
-
-    return uids
-
-
-def generate_transfer_syntax_file(uids: List[Tuple[str, str, str, bool]], output_path: Path):
-    """Generate transfer_syntax_uids.go with all Transfer Syntax UID constants."""
-    # Filter for Transfer Syntax UIDs
-    transfer_syntaxes = [(uid, name, retired) for uid, name, typ, retired in uids
-                         if typ == 'TypeTransferSyntax']
-
-    # Sort by UID
-    transfer_syntaxes.sort(key=lambda x: x[0])
-
-    # Generate constants
-    lines = [
-        '// AUTO-GENERATED - DO NOT EDIT',
-        '// Generated from DICOM PS3.6 Part 6 - Data Dictionary',
-        '// DICOM Standard Version: 2024b',
-        '//',
-        '// This file contains all Transfer Syntax UID constants for convenient access.',
-        '// Total: {} Transfer Syntax UIDs'.format(len(transfer_syntaxes)),
-        '',
-        'package uid',
-        '',
-        '// Transfer Syntax UIDs',
-        '// These are all the transfer syntaxes defined in the DICOM standard.',
-        'var (',
-    ]
-
-    # Track duplicate constant names
-    seen_names = {}
+    Returns: (transfer_syntaxes, sop_classes), each a list of (uid, name, retired)
+    tuples sorted by UID
+    """
+    # The file is ASCII Go source, so scan the raw bytes and decode only the
+    # captured fields rather than the whole file
+    content = uid_values_path.read_bytes()
+
+    # Find the uidTable declaration
+    uid_table_start = content.find(b'var uidTable = [...]Info{')
+    if uid_table_start == -1:
+        raise ValueError("Could not find uidTable in uid_values.go")
+
+    # The array literal ends at the first closing brace at column 0; entries
+    # are self-delimiting, so the entry regex can scan the region in place
+    uid_table_end = content.find(b'\n}', uid_table_start)
+    if uid_table_end == -1:
+        raise ValueError("Could not find closing brace for uidTable")
+
+    # Parse each UID entry, dispatching into a bucket by type as we go
+    transfer_syntaxes = []
+    sop_classes = []
+    buckets = {
+        b'TypeTransferSyntax': transfer_syntaxes,
+        b'TypeSOPClass': sop_classes,
+        b'TypeMetaSOPClass': sop_classes,
+    }
     skipped = 0
-
-    for uid, name, retired in transfer_syntaxes:
+    for match in _UID_ENTRY_RE.finditer(content, uid_table_start, uid_table_end):
+        uid, name, uid_type, retired = match.groups()
+        bucket = buckets.get(uid_type)
+        if bucket is None:
+            continue
         # Skip UIDs with empty names
-        if not name or name.strip() == '':
+        if not name.strip():
             skipped += 1
             continue
+        bucket.append((uid.decode(), name.decode(), retired == b'true'))
 
-        const_name = to_go_constant_name(name)
-
-        # Handle duplicates
-        if const_name in seen_names:
-            # Append UID suffix for uniqueness
-            suffix = uid.replace('.', '_')
-            const_name = const_name + '_' + suffix.split('_')[-1]
-        seen_names[const_name] = uid
-
-        # Add deprecation notice for retired UIDs
-        if retired:
-            lines.append(f'\t// {name} (RETIRED)')
-            lines.append(f'\t//')
-            lines.append(f'\t// Deprecated: This UID has been retired from the DICOM standard.')
-        else:
-            lines.append(f'\t// {name}')
-        lines.append(f'\t{const_name} = MustParse("{uid}")')
-        lines.append('')
-
-    lines.append(')')
-    lines.append('')
-
-    output_path.write_text('\n'.join(lines))
-    print(f'Generated {output_path} with {len(transfer_syntaxes) - skipped} Transfer Syntax UIDs')
     if skipped > 0:
         print(f'  (Skipped {skipped} UIDs with empty names)')
 
-
-def generate_sop_class_file(uids: List[Tuple[str, str, str, bool]], output_path: Path):
-    """Generate sop_class_uids.go with all SOP Class UID constants."""
-    # Filter for SOP Class UIDs
-    sop_classes = [(uid, name, retired) for uid, name, typ, retired in uids
-                   if typ in ('TypeSOPClass', 'TypeMetaSOPClass')]
-
     # Sort by UID
-    sop_classes.sort(key=lambda x: x[0])
-
-    # Generate constants
-    lines = [
-        '// AUTO-GENERATED - DO NOT EDIT',
-        '// Generated from DICOM PS3.6 Part 6 - Data Dictionary',
-        '// DICOM Standard Version: 2024b',
-        '//',
-        '// This file contains all SOP Class UID constants for convenient access.',
-        '// Total: {} SOP Class UIDs'.format(len(sop_classes)),
-        '',
-        'package uid',
-        '',
-        '// SOP Class UIDs (including Meta SOP Classes)',
-        '// These are all the SOP classes defined in the DICOM standard.',
-        'var (',
-    ]
+    transfer_syntaxes.sort(key=itemgetter(0))
+    sop_classes.sort(key=itemgetter(0))
 
-    # Track duplicate constant names
-    seen_names = {}
-    skipped = 0
+    return transfer_syntaxes, sop_classes
 
-    for uid, name, retired in sop_classes:
-        # Skip UIDs with empty names
-        if not name or name.strip() == '':
-            skipped += 1
-            continue
 
-        const_name = to_go_constant_name(name)
+def _generate_uid_file(uids: List[UIDEntry], label: str, section_comment: str, output_path: Path):
+    """
+    Generate a Go file declaring a constant for each UID.
 
-        # Handle duplicates
-        if const_name in seen_names:
-            # Append UID suffix for uniqueness
-            suffix = uid.replace('.', '_')
-            const_name = const_name + '_' + suffix.split('_')[-1]
-        seen_names[const_name] = uid
+    label names the UID kind (e.g. "Transfer Syntax UID") and section_comment
+    is the comment block emitted above the var declaration.
+    """
+    # Track duplicate constant names
+    seen_names = {}
 
-        # Add deprecation notice for retired UIDs
-        if retired:
-            lines.append(f'\t// {name} (RETIRED)')
-            lines.append(f'\t//')
-            lines.append(f'\t// Deprecated: This UID has been retired from the DICOM standard.')
-        else:
-            lines.append(f'\t// {name}')
-        lines.append(f'\t{const_name} = MustParse("{uid}")')
-        lines.append('')
+    # Stream constants through a buffered writer
+    with output_path.open('w', buffering=1 << 20) as f:
+        f.write(
+            '// AUTO-GENERATED - DO NOT EDIT\n'
+            '// Generated from DICOM PS3.6 Part 6 - Data Dictionary\n'
+            '// DICOM Standard Version: 2024b\n'
+            '//\n'
+            f'// This file contains all {label} constants for convenient access.\n'
+            f'// Total: {len(uids)} {label}s\n'
+            '\n'
+            'package uid\n'
+            '\n'
+            f'{section_comment}'
+            'var (\n'
+        )
+
+        for uid, name, retired in uids:
+            const_name = to_go_constant_name(name)
+
+            # Handle duplicates
+            if seen_names.setdefault(const_name, uid) != uid:
+                # Append last UID component for uniqueness
+                const_name = const_name + '_' + uid.rsplit('.', 1)[-1]
+                seen_names[const_name] = uid
+
+            # Add deprecation notice for retired UIDs
+            comment_end = _RETIRED_NOTICE if retired else '\n'
+            f.write(f'\t// {name}{comment_end}\t{const_name} = MustParse("{uid}")\n\n')
+
+        f.write(')\n')
+
+    print(f'Generated {output_path} with {len(uids)} {label}s')
+
+
+def generate_transfer_syntax_file(transfer_syntaxes: List[UIDEntry], output_path: Path):
+    """Generate transfer_syntax_uids.go with all Transfer Syntax UID constants."""
+    _generate_uid_file(
+        transfer_syntaxes,
+        'Transfer Syntax UID',
+        '// Transfer Syntax UIDs\n'
+        '// These are all the transfer syntaxes defined in the DICOM standard.\n',
+        output_path,
+    )
 
-    lines.append(')')
-    lines.append('')
 
-    output_path.write_text('\n'.join(lines))
-    print(f'Generated {output_path} with {len(sop_classes) - skipped} SOP Class UIDs')
-    if skipped > 0:
-        print(f'  (Skipped {skipped} UIDs with empty names)')
+def generate_sop_class_file(sop_classes: List[UIDEntry], output_path: Path):
+    """Generate sop_class_uids.go with all SOP Class UID constants."""
+    _generate_uid_file(
+        sop_classes,
+        'SOP Class UID',
+        '// SOP Class UIDs (including Meta SOP Classes)\n'
+        '// These are all the SOP classes defined in the DICOM standard.\n',
+        output_path,
+    )
 
 
 def main():
@@ -237,16 +211,16 @@ def main():
 
     # Parse UIDs
     print(f'Parsing {uid_values_path}...')
-    uids = parse_uid_map(uid_values_path)
-    print(f'Found {len(uids)} total UIDs')
+    transfer_syntaxes, sop_classes = parse_uid_table(uid_values_path)
+    print(f'Found {len(transfer_syntaxes)} Transfer Syntax and {len(sop_classes)} SOP Class UIDs')
 
     # Generate Transfer Syntax file
     transfer_syntax_path = script_dir / 'transfer_syntax_uids.go'
-    generate_transfer_syntax_file(uids, transfer_syntax_path)
+    generate_transfer_syntax_file(transfer_syntaxes, transfer_syntax_path)
 
     # Generate SOP Class file
     sop_class_path = script_dir / 'sop_class_uids.go'
-    generate_sop_class_file(uids, sop_class_path)
+    generate_sop_class_file(sop_classes, sop_class_path)
 
     print('Done!')
 
@@ -3,32 +3,86 @@
 Generate pkg/uid/uid_definitions.go from DICOM Part 6 XML.
 
 This script downloads the DICOM Standard Part 6 XML file and extracts UID definitions
-from Tables A-1 (UID Values) and A-2 (Well-known Frames of Reference).
+from Tables A-1 (UID Values) and A-2 (Well-known Frames of Reference). The download
+is cached under .cache/ per DICOM_VERSION; pass --refresh to fetch it again.
 
 Based on pydicom's generate_uid_dict.py:
 https://github.com/pydicom/pydicom/blob/main/util/generate_dict/generate_uid_dict.py
 
+The XML is stream-parsed with lxml when it is installed, falling back to a
+standard library SAX handler otherwise; neither builds the full document tree.
+
 Usage:
     python3 generate_uid_definitions.py
+    python3 generate_uid_definitions.py --refresh
     python3 generate_uid_definitions.py --local /path/to/dicom/xml
 """
 
 import argparse
+import io
+import os
 import re
+import shutil
 import sys
+import xml.sax
+from collections import namedtuple
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from urllib import request
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 DICOM_VERSION = "2024b"
 XML_URL = "https://dicom.nema.org/medical/dicom/current/source/docbook/part06/part06.xml"
 BR = "{http://docbook.org/ns/docbook}"
 
+# Qualified DocBook element names, built once rather than per lookup
+_TAG_PARA, _TAG_EMPH, _TAG_CAPTION, _TAG_TBODY, _TAG_TR, _TAG_TD, _TAG_TABLE = (
+    f"{BR}{name}" for name in ("para", "emphasis", "caption", "tbody", "tr", "td", "table")
+)
+_PATH_PARA_EMPH = f"{_TAG_PARA}/{_TAG_EMPH}"
+
 # Output file configuration
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_FILE = SCRIPT_DIR / "uid_definitions.go"
+CACHE_DIR = SCRIPT_DIR / ".cache"
 PACKAGE_NAME = "uid"
 
+# Captions of the Part 6 tables parsed by this script
+UID_VALUES_CAPTION = "UID Values"
+FRAMES_OF_REFERENCE_CAPTION = "Well-known Frames of Reference"
+
+# A row of Table A-1; Table A-2 rows are mapped onto the same fields
+UIDRow = namedtuple("UIDRow", "uid_value uid_name uid_keyword uid_type uid_info retired")
+
+# Invisible characters stripped from every table cell (zero-width spaces, soft hyphens)
+_CELL_TRANS = str.maketrans({"\u200b": None, "\u00ad": None})
+
+# Escapes for embedding text in a Go interpreted string literal
+_GO_ESC = str.maketrans({'"': '\\"', '\\': '\\\\'})
+
+# One uidKeys element and one single-line uidTable element per UID
+_KEY_TMPL = b'\t"%b",\n'
+_ROW_TMPL = b'\t{UID: "%b", Name: "%b", Type: Type%b, Info: "%b", Retired: %b},\n'
+
+# Word boundaries within UID Type strings (spaces, hyphens, slashes, dots)
+_WORD_SPLIT_RE = re.compile(r'[\s\-/.]+')
+
+# Known acronyms preserved when converting UID Types to Go identifiers
+_ACRONYMS = {
+    "sop": "SOP",
+    "dicom": "DICOM",
+    "ldap": "LDAP",
+    "oid": "OID",
+    "uid": "UID",
+    "uids": "UIDs",
+}
+
 # MIT License text for innolitics compatibility (though we're using official DICOM)
 MIT_LICENSE = """// Copyright (c) 2017 Innolitics, LLC.
 //
@@ -51,6 +105,7 @@ MIT_LICENSE = """// Copyright (c) 2017 Innolitics, LLC.
 // SOFTWARE."""
 
 
+@lru_cache(maxsize=None)
 def sanitize_keyword(keyword):
     """
     Convert a UID Type string to a valid Go identifier with proper capitalization.
@@ -61,121 +116,215 @@ def sanitize_keyword(keyword):
         "Well-known SOP Instance" -> "WellKnownSOPInstance"
         "Well-known frame of reference" -> "WellKnownFrameOfReference"
     """
-    # Preserve known acronyms
-    acronyms = {
-        "sop": "SOP",
-        "dicom": "DICOM",
-        "ldap": "LDAP",
-        "oid": "OID",
-        "uid": "UID",
-        "uids": "UIDs",
-    }
-
     # Split by word boundaries (spaces, hyphens, slashes, etc.)
-    words = re.split(r'[\s\-/\.]+', keyword)
+    words = _WORD_SPLIT_RE.split(keyword)
 
     # Capitalize each word, preserving acronyms
     result_words = []
     for word in words:
         if word:
             lower_word = word.lower()
-            if lower_word in acronyms:
-                result_words.append(acronyms[lower_word])
+            if lower_word in _ACRONYMS:
+                result_words.append(_ACRONYMS[lower_word])
             else:
                 result_words.append(word.capitalize())
 
     return ''.join(result_words)
 
 
-def parse_row(column_names, row):
+def parse_row(column_names, cells):
     """
-    Parse a table row from the XML.
+    Normalise the raw cell texts of a table row.
 
-    Returns dict with column_name: value mappings.
+    Returns list of cell values, one per column name.
     """
-    cell_values = []
-    for cell in row.iter(f"{BR}para"):
-        # Check for emphasis tag
-        emph_value = cell.find(f"{BR}emphasis")
-        if emph_value is not None:
-            if emph_value.text is not None:
-                cell_values.append(emph_value.text.strip().replace("\u200b", ""))
-            else:
-                cell_values.append("")
-        else:
-            if cell.text is not None:
-                cell_values.append(cell.text.strip().replace("\u200b", ""))
-            else:
-                cell_values.append("")
+    ncols = len(column_names)
+    cell_values = [cell.strip().translate(_CELL_TRANS) for cell in cells[:ncols]]
 
-    # Pad with empty string if needed
-    while len(cell_values) < len(column_names):
-        cell_values.append("")
+    # Pad with empty strings for missing trailing cells
+    return cell_values + [""] * (ncols - len(cell_values))
 
-    return {k: v for k, v in zip(column_names, cell_values)}
+
+def _row_cells(row):
+    """
+    Extract the raw text of each <td> in a table row element.
+
+    Each cell yields its emphasised text when present, otherwise its paragraph
+    text, so a cell with no <para> leaves the following columns aligned.
+    """
+    return [
+        cell.findtext(_PATH_PARA_EMPH) or cell.findtext(_TAG_PARA) or ""
+        for cell in row.iterfind(_TAG_TD)
+    ]
 
 
-def parse_table(root, labels, caption):
+class _TableHandler(xml.sax.handler.ContentHandler):
     """
-    Find and parse a table by caption.
+    SAX handler collecting the raw row cells of the tables with the given captions.
 
-    Returns list of dicts with parsed row data.
+    Mirrors _row_cells: element text is the text before the first child, and
+    only the first caption and body of each table are considered.
     """
-    for table in root.iter(f"{BR}table"):
-        caption_elem = table.find(f"{BR}caption")
-        if caption_elem is not None and caption_elem.text == caption:
-            tbody = table.find(f"{BR}tbody")
-            if tbody is None:
-                continue
-            return [parse_row(labels, row) for row in tbody.iter(f"{BR}tr")]
 
-    raise ValueError(f"No table found with caption: {caption}")
+    def __init__(self, captions):
+        super().__init__()
+        self.captions = captions
+        self.table_index = {}
+        self._stack = []
+        self._text = None
+        self._table = None
+
+    def startElementNS(self, name, qname, attrs):
+        tag = f"{{{name[0]}}}{name[1]}" if name[0] else name[1]
+        stack = self._stack
+        parent = stack[-1] if stack else None
+        grandparent = stack[-2] if len(stack) > 1 else None
+        stack.append(tag)
+        # Element text ends at the first child element
+        self._text = None
+
+        if tag == _TAG_TABLE:
+            self._table = {"caption": None, "rows": None, "in_body": False, "row": None, "cell": None}
+            return
+        table = self._table
+        if table is None:
+            return
+
+        if tag == _TAG_CAPTION and parent == _TAG_TABLE and table["caption"] is None:
+            table["caption"] = self._text = []
+        elif tag == _TAG_TBODY and parent == _TAG_TABLE and table["rows"] is None:
+            table["rows"] = []
+            table["in_body"] = True
+        elif tag == _TAG_TR and table["in_body"]:
+            table["row"] = []
+        elif tag == _TAG_TD and parent == _TAG_TR and table["row"] is not None:
+            # [paragraph text, emphasis text] of the cell's first <para>/<emphasis>
+            table["cell"] = [None, None]
+        elif table["cell"] is not None:
+            cell = table["cell"]
+            if tag == _TAG_PARA and parent == _TAG_TD and cell[0] is None:
+                cell[0] = self._text = []
+            elif tag == _TAG_EMPH and parent == _TAG_PARA and grandparent == _TAG_TD and cell[1] is None:
+                cell[1] = self._text = []
+
+    def endElementNS(self, name, qname):
+        tag = self._stack.pop()
+        self._text = None
+        table = self._table
+        if table is None:
+            return
+
+        if tag == _TAG_TD and table["cell"] is not None:
+            para, emph = ("".join(text) if text else "" for text in table["cell"])
+            table["row"].append(emph or para)
+            table["cell"] = None
+        elif tag == _TAG_TR and table["row"] is not None:
+            table["rows"].append(table["row"])
+            table["row"] = None
+        elif tag == _TAG_TBODY:
+            table["in_body"] = False
+        elif tag == _TAG_TABLE:
+            caption = "".join(table["caption"]) if table["caption"] is not None else None
+            if caption in self.captions and caption not in self.table_index and table["rows"] is not None:
+                self.table_index[caption] = table["rows"]
+            self._table = None
+
+    def characters(self, content):
+        if self._text is not None:
+            self._text.append(content)
+
+
+def index_tables(source, captions):
+    """
+    Stream-parse the XML source, collecting the rows of the tables with the
+    given captions.
+
+    Under lxml each table is discarded (along with its already-processed
+    siblings) as soon as it is complete; without lxml a SAX handler picks the
+    rows out directly. Either way the full document is never held in memory.
 
+    Returns dict mapping caption to list of raw cell text lists, one per row.
+    """
+    if not HAS_LXML:
+        parser = xml.sax.make_parser()
+        parser.setFeature(xml.sax.handler.feature_namespaces, True)
+        handler = _TableHandler(captions)
+        parser.setContentHandler(handler)
+        parser.parse(source)
+        return handler.table_index
+
+    table_index = {}
+    for _, table in ET.iterparse(source, events=("end",), tag=_TAG_TABLE, huge_tree=True):
+        caption = table.findtext(_TAG_CAPTION)
+        tbody = table.find(_TAG_TBODY)
+        if caption in captions and caption not in table_index and tbody is not None:
+            table_index[caption] = [_row_cells(row) for row in tbody.iter(_TAG_TR)]
+        table.clear()
+        while table.getprevious() is not None:
+            del table.getparent()[0]
+
+    return table_index
+
+
+def parse_table(table_index, labels, caption):
+    """
+    Parse an indexed table by caption.
 
-def parse_uid_values_table(root):
+    Returns list of cell value lists, one per row.
+    """
+    rows = table_index.get(caption)
+    if rows is None:
+        raise ValueError(f"No table found with caption: {caption}")
+    return [parse_row(labels, cells) for cells in rows]
+
+
+def parse_uid_values_table(table_index):
     """
     Parse Table A-1: UID Values
 
-    Returns list of UID info dicts.
+    Returns list of UIDRow.
     """
     labels = ["UID Value", "UID Name", "UID Keyword", "UID Type", "UID Info", "Retired"]
-    attrs = parse_table(root, labels, "UID Values")
+    rows = parse_table(table_index, labels, UID_VALUES_CAPTION)
 
     # Post-process
-    for attr in attrs:
-        name = attr["UID Name"]
+    attrs = []
+    for row in rows:
+        attr = UIDRow(*row)
+        name = attr.uid_name
 
         # Handle "(Retired)" in name
         if "(Retired)" in name:
-            attr["Retired"] = "Retired"
-            attr["UID Name"] = name.replace("(Retired)", "").strip()
+            attr = attr._replace(retired="Retired", uid_name=name.replace("(Retired)", "").strip())
 
         # Split name and info if colon present
         if ":" in name:
             parts = name.split(":", 1)
-            attr["UID Name"] = parts[0].strip()
-            attr["UID Info"] = parts[1].strip()
+            attr = attr._replace(uid_name=parts[0].strip(), uid_info=parts[1].strip())
+
+        # Replace ampersands in names
+        if "&" in attr.uid_name:
+            attr = attr._replace(uid_name=attr.uid_name.replace("&", "and"))
+
+        attrs.append(attr)
 
     return attrs
 
 
-def parse_frames_of_reference_table(root):
+def parse_frames_of_reference_table(table_index):
     """
     Parse Table A-2: Well-known Frames of Reference
 
-    Returns list of UID info dicts.
+    Returns list of UIDRow.
     """
     labels = ["UID Value", "UID Name", "UID Keyword", "Normative Reference"]
-    attrs = parse_table(root, labels, "Well-known Frames of Reference")
-
-    # Post-process
-    for attr in attrs:
-        attr["UID Type"] = "Well-known frame of reference"
-        attr["UID Info"] = ""
-        attr["Retired"] = ""
-        del attr["Normative Reference"]
+    rows = parse_table(table_index, labels, FRAMES_OF_REFERENCE_CAPTION)
 
-    return attrs
+    # Post-process: replace ampersands in names; the Normative Reference column is dropped
+    return [
+        UIDRow(uid_value, uid_name.replace("&", "and"), uid_keyword, "Well-known frame of reference", "", "")
+        for uid_value, uid_name, uid_keyword, _ in rows
+    ]
 
 
 def generate_type_enum():
@@ -217,11 +366,17 @@ type Info struct {
 '''
 
 
-def generate_common_constants(attrs):
+def _by_uid(attrs):
+    """Index UIDRow entries by UID value."""
+    return {attr.uid_value: attr for attr in attrs}
+
+
+def generate_common_constants(by_uid):
     """
     Generate exported constants for commonly-used UIDs.
 
-    Focuses on Transfer Syntaxes and important SOP Classes.
+    Focuses on Transfer Syntaxes and important SOP Classes. by_uid maps UID
+    value to UIDRow, as built by _by_uid.
     """
     # Define which UIDs to export as constants
     important_uids = {
@@ -258,14 +413,11 @@ def generate_common_constants(attrs):
 
     lines = ['// Common DICOM UIDs exported as package-level variables for convenient access.', 'var (']
 
-    # Create map for quick lookup
-    uid_map = {attr["UID Value"]: attr for attr in attrs}
-
     for uid, name in sorted(important_uids.items()):
-        if uid in uid_map:
-            attr = uid_map[uid]
-            comment = attr["UID Name"]
-            if attr["Retired"]:
+        attr = by_uid.get(uid)
+        if attr is not None:
+            comment = attr.uid_name
+            if attr.retired:
                 comment += " (Retired)"
             lines.append(f'\t// {name} - {comment}')
             lines.append(f'\t{name} = MustParse("{uid}")')
@@ -277,37 +429,62 @@ def generate_common_constants(attrs):
 
 
 def generate_uid_map(attrs):
-    """Generate the uidMap variable."""
-    lines = ['// uidMap contains metadata for all standard DICOM UIDs.', 'var uidMap = map[string]Info{']
+    """
+    Generate the sorted uidKeys and uidTable arrays as UTF-8 encoded Go source.
+
+    Entries are sorted by UID so lookup can binary search uidKeys and index
+    the matching uidTable entry, avoiding a large Go map literal. Rows are
+    formatted directly as bytes, so the largest section of the file never
+    needs a separate encode pass.
+    """
+    attrs = sorted(attrs, key=attrgetter("uid_value"))
+
+    keys = io.BytesIO()
+    keys.write(b'// uidKeys contains the UIDs of all standard DICOM UIDs in sorted order.\n')
+    keys.write(b'var uidKeys = [...]string{\n')
+
+    buf = io.BytesIO()
+    buf.write(b'// uidTable contains metadata for all standard DICOM UIDs, indexed in step with uidKeys.\n')
+    buf.write(b'var uidTable = [...]Info{\n')
 
     for attr in attrs:
-        uid = attr["UID Value"]
-        name = attr["UID Name"].replace('"', '\\"')
-        uid_type = attr["UID Type"]
-        info = attr.get("UID Info", "").replace('"', '\\"')
-        retired = "true" if attr["Retired"] == "Retired" else "false"
+        uid = attr.uid_value.encode('utf-8')
+        name = attr.uid_name.translate(_GO_ESC).encode('utf-8')
+        type_key = sanitize_keyword(attr.uid_type).encode('utf-8')
+        info = attr.uid_info.translate(_GO_ESC).encode('utf-8')
+        retired = b"true" if attr.retired == "Retired" else b"false"
 
-        # Single line format
-        lines.append(f'\t"{uid}": {{UID: "{uid}", Name: "{name}", Type: Type{sanitize_keyword(uid_type)}, Info: "{info}", Retired: {retired}}},')
+        keys.write(_KEY_TMPL % uid)
+        buf.write(_ROW_TMPL % (uid, name, type_key, info, retired))
 
-    lines.append('}')
+    keys.write(b'}\n\n')
+    buf.write(b'}')
 
-    return '\n'.join(lines)
+    return keys.getvalue() + buf.getvalue()
 
 
 def generate_helper_functions():
     """Generate helper functions for UID lookup."""
-    return '''// Lookup returns the Info for the given UID string.
+    return '''// lookup binary searches uidKeys for the given UID string and returns the
+// matching uidTable entry.
+func lookup(uid string) (Info, bool) {
+	i := sort.SearchStrings(uidKeys[:], uid)
+	if i < len(uidKeys) && uidKeys[i] == uid {
+		return uidTable[i], true
+	}
+	return Info{}, false
+}
+
+// Lookup returns the Info for the given UID string.
 // Returns false if the UID is not found in the standard dictionary.
 func Lookup(uid string) (Info, bool) {
-	info, ok := uidMap[uid]
-	return info, ok
+	return lookup(uid)
 }
 
 // Name returns the human-readable name for the given UID.
 // Returns empty string if the UID is not found.
 func Name(uid string) string {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Name
 	}
 	return ""
@@ -316,7 +493,7 @@ func Name(uid string) string {
 // IsRetired returns true if the given UID has been retired from the DICOM standard.
 // Returns false if the UID is not found or is not retired.
 func IsRetired(uid string) bool {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Retired
 	}
 	return false
@@ -325,7 +502,7 @@ func IsRetired(uid string) bool {
 // GetType returns the Type category for the given UID.
 // Returns empty Type if the UID is not found.
 func GetType(uid string) Type {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Type
 	}
 	return ""
@@ -333,7 +510,7 @@ func GetType(uid string) Type {
 
 // IsTransferSyntax returns true if the given UID represents a Transfer Syntax.
 func IsTransferSyntax(uid string) bool {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Type == TypeTransferSyntax
 	}
 	return false
@@ -341,7 +518,7 @@ func IsTransferSyntax(uid string) bool {
 
 // IsSOPClass returns true if the given UID represents a SOP Class.
 func IsSOPClass(uid string) bool {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Type == TypeSOPClass || info.Type == TypeMetaSOPClass
 	}
 	return false
@@ -351,36 +528,59 @@ func IsSOPClass(uid string) bool {
 
 def write_output_file(attrs, output_path):
     """Generate and write the complete Go source file."""
-    with open(output_path, 'w') as f:
-        # File header
-        f.write(f'// AUTO-GENERATED by {Path(__file__).name}. DO NOT EDIT.\n')
-        f.write('// Generated from DICOM PS3.6 Part 6 - Data Dictionary\n')
-        f.write(f'// DICOM Standard Version: {DICOM_VERSION}\n')
-        f.write('// Source: https://dicom.nema.org/medical/dicom/current/source/docbook/part06/part06.xml\n')
-        f.write('//\n')
-        f.write(MIT_LICENSE)
-        f.write('\n\n')
-
-        f.write(f'package {PACKAGE_NAME}\n\n')
+    # Index the rows once so every emitter that needs UID lookups shares it
+    by_uid = _by_uid(attrs)
 
+    header = ''.join([
+        # File header
+        f'// AUTO-GENERATED by {Path(__file__).name}. DO NOT EDIT.\n'
+        '// Generated from DICOM PS3.6 Part 6 - Data Dictionary\n'
+        f'// DICOM Standard Version: {DICOM_VERSION}\n'
+        '// Source: https://dicom.nema.org/medical/dicom/current/source/docbook/part06/part06.xml\n'
+        '//\n',
+        MIT_LICENSE,
+        '\n\n',
+        f'package {PACKAGE_NAME}\n\n',
+        'import "sort"\n\n',
         # Type enum
-        f.write(generate_type_enum())
-        f.write('\n')
-
+        generate_type_enum(),
+        '\n',
         # Info struct
-        f.write(generate_info_struct())
-        f.write('\n')
-
+        generate_info_struct(),
+        '\n',
         # Common constants
-        f.write(generate_common_constants(attrs))
-        f.write('\n\n')
-
-        # UID map
+        generate_common_constants(by_uid),
+        '\n\n',
+    ])
+    # Helper functions
+    footer = '\n\n' + generate_helper_functions()
+
+    # The UID table is already encoded, so it is written as-is between the
+    # encoded header and footer
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        f.write(header.encode('utf-8'))
         f.write(generate_uid_map(attrs))
-        f.write('\n\n')
+        f.write(footer.encode('utf-8'))
+
 
-        # Helper functions
-        f.write(generate_helper_functions())
+def download_xml(url, dest):
+    """
+    Download url to dest.
+
+    The response is copied in large chunks before any parsing starts, so
+    network stalls never hold up the parser. It is written to a sibling .tmp
+    file and moved into place, so an interrupted download never leaves a
+    truncated dest behind.
+    """
+    dest.parent.mkdir(exist_ok=True)
+    tmp_path = dest.with_suffix(".tmp")
+    try:
+        with request.urlopen(url) as response, open(tmp_path, "wb") as tmp:
+            shutil.copyfileobj(response, tmp, 1 << 20)
+        os.replace(tmp_path, dest)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def setup_argparse():
@@ -396,6 +596,12 @@ def setup_argparse():
         type=str,
     )
 
+    parser.add_argument(
+        "--refresh",
+        help="Re-download part06.xml even if a cached copy exists",
+        action="store_true",
+    )
+
     return parser.parse_args()
 
 
@@ -403,55 +609,51 @@ def main():
     """Main execution function."""
     args = setup_argparse()
 
-    # Get XML source
+    # Index Tables A-1 and A-2 in a single streaming pass over the XML source
+    captions = (UID_VALUES_CAPTION, FRAMES_OF_REFERENCE_CAPTION)
     if args.local:
         print(f"Using local XML from: {args.local}")
         part06_path = Path(args.local) / "part06.xml"
         if not part06_path.exists():
             print(f"Error: File not found: {part06_path}", file=sys.stderr)
             sys.exit(1)
-        tree = ET.parse(part06_path)
+        table_index = index_tables(str(part06_path), captions)
     else:
-        print(f"Downloading: {XML_URL}")
+        cache_path = CACHE_DIR / f"part06-{DICOM_VERSION}.xml"
         try:
-            with request.urlopen(XML_URL) as response:
-                tree = ET.parse(response)
-            print("Download complete, processing...")
+            if cache_path.exists() and not args.refresh:
+                print(f"Using cached XML from: {cache_path}")
+            else:
+                print(f"Downloading: {XML_URL}")
+                download_xml(XML_URL, cache_path)
+                print("Download complete, processing...")
+            table_index = index_tables(str(cache_path), captions)
         except Exception as e:
-            print(f"Error downloading XML: {e}", file=sys.stderr)
+            print(f"Error downloading or parsing XML: {e}", file=sys.stderr)
             sys.exit(1)
 
-    root = tree.getroot()
-
     # Parse tables
     print("Parsing Table A-1: UID Values...")
-    uid_values = parse_uid_values_table(root)
+    uid_values = parse_uid_values_table(table_index)
     print(f"  Found {len(uid_values)} UID entries")
 
     print("Parsing Table A-2: Well-known Frames of Reference...")
-    frames_of_ref = parse_frames_of_reference_table(root)
+    frames_of_ref = parse_frames_of_reference_table(table_index)
     print(f"  Found {len(frames_of_ref)} frame of reference entries")
 
     # Combine all UIDs
     all_uids = uid_values + frames_of_ref
     print(f"Total UIDs: {len(all_uids)}")
 
-    # Clean up data
-    for attr in all_uids:
-        # Replace ampersands
-        attr["UID Name"] = attr["UID Name"].replace("&", "and")
-        # Remove soft hyphens
-        attr["UID Value"] = attr["UID Value"].replace("\u00ad", "")
-
     # Generate output
     print(f"Writing output to: {OUTPUT_FILE}")
     write_output_file(all_uids, OUTPUT_FILE)
 
     print(f"✓ Successfully generated {OUTPUT_FILE}")
     print(f"  Total UIDs: {len(all_uids)}")
-    print(f"  Transfer Syntaxes: {sum(1 for a in all_uids if 'Transfer Syntax' in a['UID Type'])}")
-    print(f"  SOP Classes: {sum(1 for a in all_uids if 'SOP Class' in a['UID Type'])}")
-    print(f"  Retired UIDs: {sum(1 for a in all_uids if a['Retired'] == 'Retired')}")
+    print(f"  Transfer Syntaxes: {sum(1 for a in all_uids if 'Transfer Syntax' in a.uid_type)}")
+    print(f"  SOP Classes: {sum(1 for a in all_uids if 'SOP Class' in a.uid_type)}")
+    print(f"  Retired UIDs: {sum(1 for a in all_uids if a.retired == 'Retired')}")
 
 
 if __name__ == "__main__":
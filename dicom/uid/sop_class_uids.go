@@ -3,7 +3,7 @@
 // DICOM Standard Version: 2024b
 //
 // This file contains all SOP Class UID constants for convenient access.
-// Total: 320 SOP Class UIDs
+// Total: 318 SOP Class UIDs
 
 package uid
 
@@ -12,6 +12,7 @@ import (
 	"encoding/binary"
 	"errors"
 	"fmt"
+	"sort"
 	"strings"
 	"time"
 )
@@ -124,24 +125,33 @@ var (
 //   - sop_class_uids.go (auto-generated, 318 SOP Class UIDs)
 //
 // All UIDs with metadata are available via:
-//   - uidMap (all 519 UIDs from DICOM Standard 2024b)
+//   - uidTable (all 519 UIDs from DICOM Standard 2024b, sorted by UID)
 //   - Lookup(uid string) - lookup by UID string
 //   - FindByName(name string) - lookup by human-readable name
 //   - FindAllByType(Type) - find all UIDs of a specific type
 //
 // See README.md in this package for usage examples.
 
+// lookup binary searches uidKeys for the given UID string and returns the
+// matching uidTable entry.
+func lookup(uid string) (Info, bool) {
+	i := sort.SearchStrings(uidKeys[:], uid)
+	if i < len(uidKeys) && uidKeys[i] == uid {
+		return uidTable[i], true
+	}
+	return Info{}, false
+}
+
 // Lookup returns the Info for the given UID string.
 // Returns false if the UID is not found in the standard dictionary.
 func Lookup(uid string) (Info, bool) {
-	info, ok := uidMap[uid]
-	return info, ok
+	return lookup(uid)
 }
 
 // Name returns the human-readable name for the given UID.
 // Returns empty string if the UID is not found.
 func Name(uid string) string {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Name
 	}
 	return ""
@@ -150,7 +160,7 @@ func Name(uid string) string {
 // IsRetired returns true if the given UID has been retired from the DICOM standard.
 // Returns false if the UID is not found or is not retired.
 func IsRetired(uid string) bool {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Retired
 	}
 	return false
@@ -159,7 +169,7 @@ func IsRetired(uid string) bool {
 // GetType returns the Type category for the given UID.
 // Returns empty Type if the UID is not found.
 func GetType(uid string) Type {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Type
 	}
 	return ""
@@ -167,7 +177,7 @@ func GetType(uid string) Type {
 
 // IsTransferSyntax returns true if the given UID represents a Transfer Syntax.
 func IsTransferSyntax(uid string) bool {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Type == TypeTransferSyntax
 	}
 	return false
@@ -175,7 +185,7 @@ func IsTransferSyntax(uid string) bool {
 
 // IsSOPClass returns true if the given UID represents a SOP Class.
 func IsSOPClass(uid string) bool {
-	if info, ok := uidMap[uid]; ok {
+	if info, ok := lookup(uid); ok {
 		return info.Type == TypeSOPClass || info.Type == TypeMetaSOPClass
 	}
 	return false
@@ -187,7 +197,7 @@ func IsSOPClass(uid string) bool {
 // DICOM Standard Reference:
 // https://dicom.nema.org/medical/dicom/current/output/html/part06.html#chapter_A
 func Find(uid string) (Info, error) {
-	info, ok := uidMap[uid]
+	info, ok := lookup(uid)
 	if !ok {
 		return Info{}, fmt.Errorf("UID %q not found in dictionary", uid)
 	}
@@ -206,7 +216,7 @@ func FindByName(name string) (Info, error) {
 	if name == "" {
 		return Info{}, fmt.Errorf("UID name cannot be empty")
 	}
-	for _, info := range uidMap {
+	for _, info := range uidTable[:] {
 		if info.Name == name {
 			return info, nil
 		}
@@ -224,7 +234,7 @@ func FindByName(name string) (Info, error) {
 // https://dicom.nema.org/medical/dicom/current/output/html/part06.html#chapter_A
 func FindAllByType(t Type) []Info {
 	var results []Info
-	for _, info := range uidMap {
+	for _, info := range uidTable[:] {
 		if info.Type == t {
 			results = append(results, info)
 		}
@@ -309,7 +309,7 @@ func TestIsSOPClass(t *testing.T) {
 	}
 }
 
-// TestUIDMapCompleteness verifies that all exported UID constants are in uidMap
+// TestUIDMapCompleteness verifies that all exported UID constants are in uidTable
 func TestUIDMapCompleteness(t *testing.T) {
 	exportedUIDs := []struct {
 		name string
@@ -345,18 +345,18 @@ func TestUIDMapCompleteness(t *testing.T) {
 	for _, tt := range exportedUIDs {
 		t.Run(tt.name, func(t *testing.T) {
 			_, found := Lookup(tt.uid.String())
-			assert.True(t, found, "exported UID %s not found in uidMap", tt.name)
+			assert.True(t, found, "exported UID %s not found in uidTable", tt.name)
 		})
 	}
 }
 
-// TestUIDMapStatistics verifies the basic statistics of the uidMap
+// TestUIDMapStatistics verifies the basic statistics of the uidTable
 func TestUIDMapStatistics(t *testing.T) {
-	assert.Greater(t, len(uidMap), 400, "uidMap should contain at least 400 entries")
+	assert.Greater(t, len(uidTable), 400, "uidTable should contain at least 400 entries")
 
 	var transferSyntaxCount, sopClassCount, retiredCount int
 
-	for _, info := range uidMap {
+	for _, info := range uidTable[:] {
 		switch info.Type {
 		case TypeTransferSyntax:
 			transferSyntaxCount++
@@ -373,6 +373,19 @@ func TestUIDMapStatistics(t *testing.T) {
 	assert.Greater(t, retiredCount, 50, "should have at least 50 retired UIDs")
 }
 
+// TestUIDTableSorted verifies that uidKeys is strictly sorted and in step with
+// uidTable, which lookup relies on for its binary search
+func TestUIDTableSorted(t *testing.T) {
+	assert.Equal(t, len(uidKeys), len(uidTable), "uidKeys and uidTable should have the same length")
+
+	for i, uid := range uidKeys[:] {
+		assert.Equal(t, uid, uidTable[i].UID, "uidTable entry %d out of step with uidKeys", i)
+		if i > 0 {
+			assert.Less(t, uidKeys[i-1], uid, "uidKeys not strictly sorted at index %d", i)
+		}
+	}
+}
+
 func TestFind(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -56,499 +56,996 @@ type Info struct {
 	Retired bool   // True if the UID has been retired
 }
 
-// uidMap contains metadata for all standard DICOM UIDs.
-var uidMap = map[string]Info{
-	"1.2.840.10008.1.1":                {UID: "1.2.840.10008.1.1", Name: "Verification SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.1.2":                {UID: "1.2.840.10008.1.2", Name: "Implicit VR Little Endian", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for DICOM", Retired: false},
-	"1.2.840.10008.1.2.1":              {UID: "1.2.840.10008.1.2.1", Name: "Explicit VR Little Endian", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.1.98":           {UID: "1.2.840.10008.1.2.1.98", Name: "Encapsulated Uncompressed Explicit VR Little Endian", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.1.99":           {UID: "1.2.840.10008.1.2.1.99", Name: "Deflated Explicit VR Little Endian", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.2":              {UID: "1.2.840.10008.1.2.2", Name: "Explicit VR Big Endian", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.50":           {UID: "1.2.840.10008.1.2.4.50", Name: "JPEG Baseline (Process 1)", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for Lossy JPEG 8 Bit Image Compression", Retired: false},
-	"1.2.840.10008.1.2.4.51":           {UID: "1.2.840.10008.1.2.4.51", Name: "JPEG Extended (Process 2 and 4)", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for Lossy JPEG 12 Bit Image Compression (Process 4 only)", Retired: false},
-	"1.2.840.10008.1.2.4.52":           {UID: "1.2.840.10008.1.2.4.52", Name: "JPEG Extended (Process 3 and 5)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.53":           {UID: "1.2.840.10008.1.2.4.53", Name: "JPEG Spectral Selection, Non-Hierarchical (Process 6 and 8)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.54":           {UID: "1.2.840.10008.1.2.4.54", Name: "JPEG Spectral Selection, Non-Hierarchical (Process 7 and 9)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.55":           {UID: "1.2.840.10008.1.2.4.55", Name: "JPEG Full Progression, Non-Hierarchical (Process 10 and 12)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.56":           {UID: "1.2.840.10008.1.2.4.56", Name: "JPEG Full Progression, Non-Hierarchical (Process 11 and 13)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.57":           {UID: "1.2.840.10008.1.2.4.57", Name: "JPEG Lossless, Non-Hierarchical (Process 14)", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.58":           {UID: "1.2.840.10008.1.2.4.58", Name: "JPEG Lossless, Non-Hierarchical (Process 15)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.59":           {UID: "1.2.840.10008.1.2.4.59", Name: "JPEG Extended, Hierarchical (Process 16 and 18)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.60":           {UID: "1.2.840.10008.1.2.4.60", Name: "JPEG Extended, Hierarchical (Process 17 and 19)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.61":           {UID: "1.2.840.10008.1.2.4.61", Name: "JPEG Spectral Selection, Hierarchical (Process 20 and 22)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.62":           {UID: "1.2.840.10008.1.2.4.62", Name: "JPEG Spectral Selection, Hierarchical (Process 21 and 23)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.63":           {UID: "1.2.840.10008.1.2.4.63", Name: "JPEG Full Progression, Hierarchical (Process 24 and 26)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.64":           {UID: "1.2.840.10008.1.2.4.64", Name: "JPEG Full Progression, Hierarchical (Process 25 and 27)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.65":           {UID: "1.2.840.10008.1.2.4.65", Name: "JPEG Lossless, Hierarchical (Process 28)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.66":           {UID: "1.2.840.10008.1.2.4.66", Name: "JPEG Lossless, Hierarchical (Process 29)", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.4.70":           {UID: "1.2.840.10008.1.2.4.70", Name: "JPEG Lossless, Non-Hierarchical, First-Order Prediction (Process 14 [Selection Value 1])", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for Lossless JPEG Image Compression", Retired: false},
-	"1.2.840.10008.1.2.4.80":           {UID: "1.2.840.10008.1.2.4.80", Name: "JPEG-LS Lossless Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.81":           {UID: "1.2.840.10008.1.2.4.81", Name: "JPEG-LS Lossy (Near-Lossless) Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.90":           {UID: "1.2.840.10008.1.2.4.90", Name: "JPEG 2000 Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.91":           {UID: "1.2.840.10008.1.2.4.91", Name: "JPEG 2000 Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.92":           {UID: "1.2.840.10008.1.2.4.92", Name: "JPEG 2000 Part 2 Multi-component Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.93":           {UID: "1.2.840.10008.1.2.4.93", Name: "JPEG 2000 Part 2 Multi-component Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.94":           {UID: "1.2.840.10008.1.2.4.94", Name: "JPIP Referenced", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.95":           {UID: "1.2.840.10008.1.2.4.95", Name: "JPIP Referenced Deflate", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.100":          {UID: "1.2.840.10008.1.2.4.100", Name: "MPEG2 Main Profile / Main Level", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.100.1":        {UID: "1.2.840.10008.1.2.4.100.1", Name: "Fragmentable MPEG2 Main Profile / Main Level", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.101":          {UID: "1.2.840.10008.1.2.4.101", Name: "MPEG2 Main Profile / High Level", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.101.1":        {UID: "1.2.840.10008.1.2.4.101.1", Name: "Fragmentable MPEG2 Main Profile / High Level", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.102":          {UID: "1.2.840.10008.1.2.4.102", Name: "MPEG-4 AVC/H.264 High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.102.1":        {UID: "1.2.840.10008.1.2.4.102.1", Name: "Fragmentable MPEG-4 AVC/H.264 High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.103":          {UID: "1.2.840.10008.1.2.4.103", Name: "MPEG-4 AVC/H.264 BD-compatible High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.103.1":        {UID: "1.2.840.10008.1.2.4.103.1", Name: "Fragmentable MPEG-4 AVC/H.264 BD-compatible High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.104":          {UID: "1.2.840.10008.1.2.4.104", Name: "MPEG-4 AVC/H.264 High Profile / Level 4.2 For 2D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.104.1":        {UID: "1.2.840.10008.1.2.4.104.1", Name: "Fragmentable MPEG-4 AVC/H.264 High Profile / Level 4.2 For 2D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.105":          {UID: "1.2.840.10008.1.2.4.105", Name: "MPEG-4 AVC/H.264 High Profile / Level 4.2 For 3D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.105.1":        {UID: "1.2.840.10008.1.2.4.105.1", Name: "Fragmentable MPEG-4 AVC/H.264 High Profile / Level 4.2 For 3D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.106":          {UID: "1.2.840.10008.1.2.4.106", Name: "MPEG-4 AVC/H.264 Stereo High Profile / Level 4.2", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.106.1":        {UID: "1.2.840.10008.1.2.4.106.1", Name: "Fragmentable MPEG-4 AVC/H.264 Stereo High Profile / Level 4.2", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.107":          {UID: "1.2.840.10008.1.2.4.107", Name: "HEVC/H.265 Main Profile / Level 5.1", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.108":          {UID: "1.2.840.10008.1.2.4.108", Name: "HEVC/H.265 Main 10 Profile / Level 5.1", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.110":          {UID: "1.2.840.10008.1.2.4.110", Name: "JPEG XL Lossless", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.111":          {UID: "1.2.840.10008.1.2.4.111", Name: "JPEG XL JPEG Recompression", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.112":          {UID: "1.2.840.10008.1.2.4.112", Name: "JPEG XL", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.201":          {UID: "1.2.840.10008.1.2.4.201", Name: "High-Throughput JPEG 2000 Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.202":          {UID: "1.2.840.10008.1.2.4.202", Name: "High-Throughput JPEG 2000 with RPCL Options Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.203":          {UID: "1.2.840.10008.1.2.4.203", Name: "High-Throughput JPEG 2000 Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.204":          {UID: "1.2.840.10008.1.2.4.204", Name: "JPIP HTJ2K Referenced", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.4.205":          {UID: "1.2.840.10008.1.2.4.205", Name: "JPIP HTJ2K Referenced Deflate", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.5":              {UID: "1.2.840.10008.1.2.5", Name: "RLE Lossless", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.6.1":            {UID: "1.2.840.10008.1.2.6.1", Name: "RFC 2557 MIME encapsulation", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.6.2":            {UID: "1.2.840.10008.1.2.6.2", Name: "XML Encoding", Type: TypeTransferSyntax, Info: "", Retired: true},
-	"1.2.840.10008.1.2.7.1":            {UID: "1.2.840.10008.1.2.7.1", Name: "SMPTE ST 2110-20 Uncompressed Progressive Active Video", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.7.2":            {UID: "1.2.840.10008.1.2.7.2", Name: "SMPTE ST 2110-20 Uncompressed Interlaced Active Video", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.7.3":            {UID: "1.2.840.10008.1.2.7.3", Name: "SMPTE ST 2110-30 PCM Digital Audio", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.2.8.1":            {UID: "1.2.840.10008.1.2.8.1", Name: "Deflated Image Frame Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
-	"1.2.840.10008.1.3.10":             {UID: "1.2.840.10008.1.3.10", Name: "Media Storage Directory Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.1.5.1":              {UID: "1.2.840.10008.1.5.1", Name: "Hot Iron Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.5.2":              {UID: "1.2.840.10008.1.5.2", Name: "PET Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.5.3":              {UID: "1.2.840.10008.1.5.3", Name: "Hot Metal Blue Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.5.4":              {UID: "1.2.840.10008.1.5.4", Name: "PET 20 Step Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.5.5":              {UID: "1.2.840.10008.1.5.5", Name: "Spring Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.5.6":              {UID: "1.2.840.10008.1.5.6", Name: "Summer Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.5.7":              {UID: "1.2.840.10008.1.5.7", Name: "Fall Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.5.8":              {UID: "1.2.840.10008.1.5.8", Name: "Winter Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.9":                {UID: "1.2.840.10008.1.9", Name: "Basic Study Content Notification SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.1.20":               {UID: "1.2.840.10008.1.20", Name: "Papyrus 3 Implicit VR Little Endian", Type: TypeTransferSyntax, Info: "(2015c)", Retired: true},
-	"1.2.840.10008.1.20.1":             {UID: "1.2.840.10008.1.20.1", Name: "Storage Commitment Push Model SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.1.20.1.1":           {UID: "1.2.840.10008.1.20.1.1", Name: "Storage Commitment Push Model SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.20.2":             {UID: "1.2.840.10008.1.20.2", Name: "Storage Commitment Pull Model SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.1.20.2.1":           {UID: "1.2.840.10008.1.20.2.1", Name: "Storage Commitment Pull Model SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: true},
-	"1.2.840.10008.1.40":               {UID: "1.2.840.10008.1.40", Name: "Procedural Event Logging SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.1.40.1":             {UID: "1.2.840.10008.1.40.1", Name: "Procedural Event Logging SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.1.42":               {UID: "1.2.840.10008.1.42", Name: "Substance Administration Logging SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.1.42.1":             {UID: "1.2.840.10008.1.42.1", Name: "Substance Administration Logging SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.2.6.1":              {UID: "1.2.840.10008.2.6.1", Name: "DICOM UID Registry", Type: TypeDICOMUIDsAsACodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.4":             {UID: "1.2.840.10008.2.16.4", Name: "DICOM Controlled Terminology", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.5":             {UID: "1.2.840.10008.2.16.5", Name: "Adult Mouse Anatomy Ontology", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.6":             {UID: "1.2.840.10008.2.16.6", Name: "Uberon Ontology", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.7":             {UID: "1.2.840.10008.2.16.7", Name: "Integrated Taxonomic Information System (ITIS) Taxonomic Serial Number (TSN)", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.8":             {UID: "1.2.840.10008.2.16.8", Name: "Mouse Genome Initiative (MGI)", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.9":             {UID: "1.2.840.10008.2.16.9", Name: "PubChem Compound CID", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.10":            {UID: "1.2.840.10008.2.16.10", Name: "Dublin Core", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.11":            {UID: "1.2.840.10008.2.16.11", Name: "New York University Melanoma Clinical Cooperative Group", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.12":            {UID: "1.2.840.10008.2.16.12", Name: "Mayo Clinic Non-radiological Images Specific Body Structure Anatomical Surface Region Guide", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.13":            {UID: "1.2.840.10008.2.16.13", Name: "Image Biomarker Standardization Initiative", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.14":            {UID: "1.2.840.10008.2.16.14", Name: "Radiomics Ontology", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.15":            {UID: "1.2.840.10008.2.16.15", Name: "RadElement", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.16":            {UID: "1.2.840.10008.2.16.16", Name: "ICD-11", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.17":            {UID: "1.2.840.10008.2.16.17", Name: "Unified numbering system (UNS) for metals and alloys", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.2.16.18":            {UID: "1.2.840.10008.2.16.18", Name: "Research Resource Identification", Type: TypeCodingScheme, Info: "", Retired: false},
-	"1.2.840.10008.3.1.1.1":            {UID: "1.2.840.10008.3.1.1.1", Name: "DICOM Application Context Name", Type: TypeApplicationContextName, Info: "", Retired: false},
-	"1.2.840.10008.3.1.2.1.1":          {UID: "1.2.840.10008.3.1.2.1.1", Name: "Detached Patient Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.1.4":          {UID: "1.2.840.10008.3.1.2.1.4", Name: "Detached Patient Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.2.1":          {UID: "1.2.840.10008.3.1.2.2.1", Name: "Detached Visit Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.3.1":          {UID: "1.2.840.10008.3.1.2.3.1", Name: "Detached Study Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.3.2":          {UID: "1.2.840.10008.3.1.2.3.2", Name: "Study Component Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.3.3":          {UID: "1.2.840.10008.3.1.2.3.3", Name: "Modality Performed Procedure Step SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.3.1.2.3.4":          {UID: "1.2.840.10008.3.1.2.3.4", Name: "Modality Performed Procedure Step Retrieve SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.3.1.2.3.5":          {UID: "1.2.840.10008.3.1.2.3.5", Name: "Modality Performed Procedure Step Notification SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.3.1.2.5.1":          {UID: "1.2.840.10008.3.1.2.5.1", Name: "Detached Results Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.5.4":          {UID: "1.2.840.10008.3.1.2.5.4", Name: "Detached Results Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.5.5":          {UID: "1.2.840.10008.3.1.2.5.5", Name: "Detached Study Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.3.1.2.6.1":          {UID: "1.2.840.10008.3.1.2.6.1", Name: "Detached Interpretation Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.4.2":                {UID: "1.2.840.10008.4.2", Name: "Storage Service Class", Type: TypeServiceClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.1":            {UID: "1.2.840.10008.5.1.1.1", Name: "Basic Film Session SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.2":            {UID: "1.2.840.10008.5.1.1.2", Name: "Basic Film Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.4":            {UID: "1.2.840.10008.5.1.1.4", Name: "Basic Grayscale Image Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.4.1":          {UID: "1.2.840.10008.5.1.1.4.1", Name: "Basic Color Image Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.4.2":          {UID: "1.2.840.10008.5.1.1.4.2", Name: "Referenced Image Box SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.9":            {UID: "1.2.840.10008.5.1.1.9", Name: "Basic Grayscale Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.9.1":          {UID: "1.2.840.10008.5.1.1.9.1", Name: "Referenced Grayscale Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.14":           {UID: "1.2.840.10008.5.1.1.14", Name: "Print Job SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.15":           {UID: "1.2.840.10008.5.1.1.15", Name: "Basic Annotation Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.16":           {UID: "1.2.840.10008.5.1.1.16", Name: "Printer SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.16.376":       {UID: "1.2.840.10008.5.1.1.16.376", Name: "Printer Configuration Retrieval SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.17":           {UID: "1.2.840.10008.5.1.1.17", Name: "Printer SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.17.376":       {UID: "1.2.840.10008.5.1.1.17.376", Name: "Printer Configuration Retrieval SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.18":           {UID: "1.2.840.10008.5.1.1.18", Name: "Basic Color Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.18.1":         {UID: "1.2.840.10008.5.1.1.18.1", Name: "Referenced Color Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.22":           {UID: "1.2.840.10008.5.1.1.22", Name: "VOI LUT Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.23":           {UID: "1.2.840.10008.5.1.1.23", Name: "Presentation LUT SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.24":           {UID: "1.2.840.10008.5.1.1.24", Name: "Image Overlay Box SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.24.1":         {UID: "1.2.840.10008.5.1.1.24.1", Name: "Basic Print Image Overlay Box SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.25":           {UID: "1.2.840.10008.5.1.1.25", Name: "Print Queue SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.26":           {UID: "1.2.840.10008.5.1.1.26", Name: "Print Queue Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.27":           {UID: "1.2.840.10008.5.1.1.27", Name: "Stored Print Storage SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.29":           {UID: "1.2.840.10008.5.1.1.29", Name: "Hardcopy Grayscale Image Storage SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.30":           {UID: "1.2.840.10008.5.1.1.30", Name: "Hardcopy Color Image Storage SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.31":           {UID: "1.2.840.10008.5.1.1.31", Name: "Pull Print Request SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.32":           {UID: "1.2.840.10008.5.1.1.32", Name: "Pull Stored Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.1.33":           {UID: "1.2.840.10008.5.1.1.33", Name: "Media Creation Management SOP Class UID", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.40":           {UID: "1.2.840.10008.5.1.1.40", Name: "Display System SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.1.40.1":         {UID: "1.2.840.10008.5.1.1.40.1", Name: "Display System SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.1":        {UID: "1.2.840.10008.5.1.4.1.1.1", Name: "Computed Radiography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.1.1":      {UID: "1.2.840.10008.5.1.4.1.1.1.1", Name: "Digital X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.1.1.1":    {UID: "1.2.840.10008.5.1.4.1.1.1.1.1", Name: "Digital X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.1.2":      {UID: "1.2.840.10008.5.1.4.1.1.1.2", Name: "Digital Mammography X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.1.2.1":    {UID: "1.2.840.10008.5.1.4.1.1.1.2.1", Name: "Digital Mammography X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.1.3":      {UID: "1.2.840.10008.5.1.4.1.1.1.3", Name: "Digital Intra-Oral X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.1.3.1":    {UID: "1.2.840.10008.5.1.4.1.1.1.3.1", Name: "Digital Intra-Oral X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.2":        {UID: "1.2.840.10008.5.1.4.1.1.2", Name: "CT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.2.1":      {UID: "1.2.840.10008.5.1.4.1.1.2.1", Name: "Enhanced CT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.2.2":      {UID: "1.2.840.10008.5.1.4.1.1.2.2", Name: "Legacy Converted Enhanced CT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.3":        {UID: "1.2.840.10008.5.1.4.1.1.3", Name: "Ultrasound Multi-frame Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.3.1":      {UID: "1.2.840.10008.5.1.4.1.1.3.1", Name: "Ultrasound Multi-frame Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.4":        {UID: "1.2.840.10008.5.1.4.1.1.4", Name: "MR Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.4.1":      {UID: "1.2.840.10008.5.1.4.1.1.4.1", Name: "Enhanced MR Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.4.2":      {UID: "1.2.840.10008.5.1.4.1.1.4.2", Name: "MR Spectroscopy Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.4.3":      {UID: "1.2.840.10008.5.1.4.1.1.4.3", Name: "Enhanced MR Color Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.4.4":      {UID: "1.2.840.10008.5.1.4.1.1.4.4", Name: "Legacy Converted Enhanced MR Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.5":        {UID: "1.2.840.10008.5.1.4.1.1.5", Name: "Nuclear Medicine Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.6":        {UID: "1.2.840.10008.5.1.4.1.1.6", Name: "Ultrasound Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.6.1":      {UID: "1.2.840.10008.5.1.4.1.1.6.1", Name: "Ultrasound Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.6.2":      {UID: "1.2.840.10008.5.1.4.1.1.6.2", Name: "Enhanced US Volume Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.6.3":      {UID: "1.2.840.10008.5.1.4.1.1.6.3", Name: "Photoacoustic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.7":        {UID: "1.2.840.10008.5.1.4.1.1.7", Name: "Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.7.1":      {UID: "1.2.840.10008.5.1.4.1.1.7.1", Name: "Multi-frame Single Bit Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.7.2":      {UID: "1.2.840.10008.5.1.4.1.1.7.2", Name: "Multi-frame Grayscale Byte Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.7.3":      {UID: "1.2.840.10008.5.1.4.1.1.7.3", Name: "Multi-frame Grayscale Word Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.7.4":      {UID: "1.2.840.10008.5.1.4.1.1.7.4", Name: "Multi-frame True Color Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.8":        {UID: "1.2.840.10008.5.1.4.1.1.8", Name: "Standalone Overlay Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.9":        {UID: "1.2.840.10008.5.1.4.1.1.9", Name: "Standalone Curve Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.9.1":      {UID: "1.2.840.10008.5.1.4.1.1.9.1", Name: "Waveform Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.9.1.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.1.1", Name: "12-lead ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.1.2":    {UID: "1.2.840.10008.5.1.4.1.1.9.1.2", Name: "General ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.1.3":    {UID: "1.2.840.10008.5.1.4.1.1.9.1.3", Name: "Ambulatory ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.1.4":    {UID: "1.2.840.10008.5.1.4.1.1.9.1.4", Name: "General 32-bit ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.2.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.2.1", Name: "Hemodynamic Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.3.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.3.1", Name: "Cardiac Electrophysiology Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.4.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.4.1", Name: "Basic Voice Audio Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.4.2":    {UID: "1.2.840.10008.5.1.4.1.1.9.4.2", Name: "General Audio Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.5.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.5.1", Name: "Arterial Pulse Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.6.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.6.1", Name: "Respiratory Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.6.2":    {UID: "1.2.840.10008.5.1.4.1.1.9.6.2", Name: "Multi-channel Respiratory Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.7.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.7.1", Name: "Routine Scalp Electroencephalogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.7.2":    {UID: "1.2.840.10008.5.1.4.1.1.9.7.2", Name: "Electromyogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.7.3":    {UID: "1.2.840.10008.5.1.4.1.1.9.7.3", Name: "Electrooculogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.7.4":    {UID: "1.2.840.10008.5.1.4.1.1.9.7.4", Name: "Sleep Electroencephalogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.8.1":    {UID: "1.2.840.10008.5.1.4.1.1.9.8.1", Name: "Body Position Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.100.1":  {UID: "1.2.840.10008.5.1.4.1.1.9.100.1", Name: "Waveform Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.9.100.2":  {UID: "1.2.840.10008.5.1.4.1.1.9.100.2", Name: "Waveform Acquisition Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.10":       {UID: "1.2.840.10008.5.1.4.1.1.10", Name: "Standalone Modality LUT Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.11":       {UID: "1.2.840.10008.5.1.4.1.1.11", Name: "Standalone VOI LUT Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.11.1":     {UID: "1.2.840.10008.5.1.4.1.1.11.1", Name: "Grayscale Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.2":     {UID: "1.2.840.10008.5.1.4.1.1.11.2", Name: "Color Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.3":     {UID: "1.2.840.10008.5.1.4.1.1.11.3", Name: "Pseudo-Color Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.4":     {UID: "1.2.840.10008.5.1.4.1.1.11.4", Name: "Blending Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.5":     {UID: "1.2.840.10008.5.1.4.1.1.11.5", Name: "XA/XRF Grayscale Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.6":     {UID: "1.2.840.10008.5.1.4.1.1.11.6", Name: "Grayscale Planar MPR Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.7":     {UID: "1.2.840.10008.5.1.4.1.1.11.7", Name: "Compositing Planar MPR Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.8":     {UID: "1.2.840.10008.5.1.4.1.1.11.8", Name: "Advanced Blending Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.9":     {UID: "1.2.840.10008.5.1.4.1.1.11.9", Name: "Volume Rendering Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.10":    {UID: "1.2.840.10008.5.1.4.1.1.11.10", Name: "Segmented Volume Rendering Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.11":    {UID: "1.2.840.10008.5.1.4.1.1.11.11", Name: "Multiple Volume Rendering Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.11.12":    {UID: "1.2.840.10008.5.1.4.1.1.11.12", Name: "Variable Modality LUT Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.12.1":     {UID: "1.2.840.10008.5.1.4.1.1.12.1", Name: "X-Ray Angiographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.12.1.1":   {UID: "1.2.840.10008.5.1.4.1.1.12.1.1", Name: "Enhanced XA Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.12.2":     {UID: "1.2.840.10008.5.1.4.1.1.12.2", Name: "X-Ray Radiofluoroscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.12.2.1":   {UID: "1.2.840.10008.5.1.4.1.1.12.2.1", Name: "Enhanced XRF Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.12.3":     {UID: "1.2.840.10008.5.1.4.1.1.12.3", Name: "X-Ray Angiographic Bi-Plane Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.12.77":    {UID: "1.2.840.10008.5.1.4.1.1.12.77", Name: "", Type: TypeSOPClass, Info: "(2015c)", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.13.1.1":   {UID: "1.2.840.10008.5.1.4.1.1.13.1.1", Name: "X-Ray 3D Angiographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.13.1.2":   {UID: "1.2.840.10008.5.1.4.1.1.13.1.2", Name: "X-Ray 3D Craniofacial Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.13.1.3":   {UID: "1.2.840.10008.5.1.4.1.1.13.1.3", Name: "Breast Tomosynthesis Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.13.1.4":   {UID: "1.2.840.10008.5.1.4.1.1.13.1.4", Name: "Breast Projection X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.13.1.5":   {UID: "1.2.840.10008.5.1.4.1.1.13.1.5", Name: "Breast Projection X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.14.1":     {UID: "1.2.840.10008.5.1.4.1.1.14.1", Name: "Intravascular Optical Coherence Tomography Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.14.2":     {UID: "1.2.840.10008.5.1.4.1.1.14.2", Name: "Intravascular Optical Coherence Tomography Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.20":       {UID: "1.2.840.10008.5.1.4.1.1.20", Name: "Nuclear Medicine Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.30":       {UID: "1.2.840.10008.5.1.4.1.1.30", Name: "Parametric Map Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.40":       {UID: "1.2.840.10008.5.1.4.1.1.40", Name: "", Type: TypeSOPClass, Info: "(2015c)", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.66":       {UID: "1.2.840.10008.5.1.4.1.1.66", Name: "Raw Data Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.1":     {UID: "1.2.840.10008.5.1.4.1.1.66.1", Name: "Spatial Registration Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.2":     {UID: "1.2.840.10008.5.1.4.1.1.66.2", Name: "Spatial Fiducials Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.3":     {UID: "1.2.840.10008.5.1.4.1.1.66.3", Name: "Deformable Spatial Registration Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.4":     {UID: "1.2.840.10008.5.1.4.1.1.66.4", Name: "Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.5":     {UID: "1.2.840.10008.5.1.4.1.1.66.5", Name: "Surface Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.6":     {UID: "1.2.840.10008.5.1.4.1.1.66.6", Name: "Tractography Results Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.7":     {UID: "1.2.840.10008.5.1.4.1.1.66.7", Name: "Label Map Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.66.8":     {UID: "1.2.840.10008.5.1.4.1.1.66.8", Name: "Height Map Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.67":       {UID: "1.2.840.10008.5.1.4.1.1.67", Name: "Real World Value Mapping Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.68.1":     {UID: "1.2.840.10008.5.1.4.1.1.68.1", Name: "Surface Scan Mesh Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.68.2":     {UID: "1.2.840.10008.5.1.4.1.1.68.2", Name: "Surface Scan Point Cloud Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1":     {UID: "1.2.840.10008.5.1.4.1.1.77.1", Name: "VL Image Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.77.2":     {UID: "1.2.840.10008.5.1.4.1.1.77.2", Name: "VL Multi-frame Image Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.77.1.1":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.1", Name: "VL Endoscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.1.1": {UID: "1.2.840.10008.5.1.4.1.1.77.1.1.1", Name: "Video Endoscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.2":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.2", Name: "VL Microscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.2.1": {UID: "1.2.840.10008.5.1.4.1.1.77.1.2.1", Name: "Video Microscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.3":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.3", Name: "VL Slide-Coordinates Microscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.4":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.4", Name: "VL Photographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.4.1": {UID: "1.2.840.10008.5.1.4.1.1.77.1.4.1", Name: "Video Photographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.1": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.1", Name: "Ophthalmic Photography 8 Bit Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.2": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.2", Name: "Ophthalmic Photography 16 Bit Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.3": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.3", Name: "Stereometric Relationship Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.4": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.4", Name: "Ophthalmic Tomography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.5": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.5", Name: "Wide Field Ophthalmic Photography Stereographic Projection Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.6": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.6", Name: "Wide Field Ophthalmic Photography 3D Coordinates Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.7": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.7", Name: "Ophthalmic Optical Coherence Tomography En Face Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.5.8": {UID: "1.2.840.10008.5.1.4.1.1.77.1.5.8", Name: "Ophthalmic Optical Coherence Tomography B-scan Volume Analysis Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.6":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.6", Name: "VL Whole Slide Microscopy Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.7":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.7", Name: "Dermoscopic Photography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.8":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.8", Name: "Confocal Microscopy Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.77.1.9":   {UID: "1.2.840.10008.5.1.4.1.1.77.1.9", Name: "Confocal Microscopy Tiled Pyramidal Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.1":     {UID: "1.2.840.10008.5.1.4.1.1.78.1", Name: "Lensometry Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.2":     {UID: "1.2.840.10008.5.1.4.1.1.78.2", Name: "Autorefraction Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.3":     {UID: "1.2.840.10008.5.1.4.1.1.78.3", Name: "Keratometry Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.4":     {UID: "1.2.840.10008.5.1.4.1.1.78.4", Name: "Subjective Refraction Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.5":     {UID: "1.2.840.10008.5.1.4.1.1.78.5", Name: "Visual Acuity Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.6":     {UID: "1.2.840.10008.5.1.4.1.1.78.6", Name: "Spectacle Prescription Report Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.7":     {UID: "1.2.840.10008.5.1.4.1.1.78.7", Name: "Ophthalmic Axial Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.78.8":     {UID: "1.2.840.10008.5.1.4.1.1.78.8", Name: "Intraocular Lens Calculations Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.79.1":     {UID: "1.2.840.10008.5.1.4.1.1.79.1", Name: "Macular Grid Thickness and Volume Report Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.80.1":     {UID: "1.2.840.10008.5.1.4.1.1.80.1", Name: "Ophthalmic Visual Field Static Perimetry Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.81.1":     {UID: "1.2.840.10008.5.1.4.1.1.81.1", Name: "Ophthalmic Thickness Map Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.82.1":     {UID: "1.2.840.10008.5.1.4.1.1.82.1", Name: "Corneal Topography Map Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.1":     {UID: "1.2.840.10008.5.1.4.1.1.88.1", Name: "Text SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.88.2":     {UID: "1.2.840.10008.5.1.4.1.1.88.2", Name: "Audio SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.88.3":     {UID: "1.2.840.10008.5.1.4.1.1.88.3", Name: "Detail SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.88.4":     {UID: "1.2.840.10008.5.1.4.1.1.88.4", Name: "Comprehensive SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.88.11":    {UID: "1.2.840.10008.5.1.4.1.1.88.11", Name: "Basic Text SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.22":    {UID: "1.2.840.10008.5.1.4.1.1.88.22", Name: "Enhanced SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.33":    {UID: "1.2.840.10008.5.1.4.1.1.88.33", Name: "Comprehensive SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.34":    {UID: "1.2.840.10008.5.1.4.1.1.88.34", Name: "Comprehensive 3D SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.35":    {UID: "1.2.840.10008.5.1.4.1.1.88.35", Name: "Extensible SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.40":    {UID: "1.2.840.10008.5.1.4.1.1.88.40", Name: "Procedure Log Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.50":    {UID: "1.2.840.10008.5.1.4.1.1.88.50", Name: "Mammography CAD SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.59":    {UID: "1.2.840.10008.5.1.4.1.1.88.59", Name: "Key Object Selection Document Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.65":    {UID: "1.2.840.10008.5.1.4.1.1.88.65", Name: "Chest CAD SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.67":    {UID: "1.2.840.10008.5.1.4.1.1.88.67", Name: "X-Ray Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.68":    {UID: "1.2.840.10008.5.1.4.1.1.88.68", Name: "Radiopharmaceutical Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.69":    {UID: "1.2.840.10008.5.1.4.1.1.88.69", Name: "Colon CAD SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.70":    {UID: "1.2.840.10008.5.1.4.1.1.88.70", Name: "Implantation Plan SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.71":    {UID: "1.2.840.10008.5.1.4.1.1.88.71", Name: "Acquisition Context SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.72":    {UID: "1.2.840.10008.5.1.4.1.1.88.72", Name: "Simplified Adult Echo SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.73":    {UID: "1.2.840.10008.5.1.4.1.1.88.73", Name: "Patient Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.74":    {UID: "1.2.840.10008.5.1.4.1.1.88.74", Name: "Planned Imaging Agent Administration SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.75":    {UID: "1.2.840.10008.5.1.4.1.1.88.75", Name: "Performed Imaging Agent Administration SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.76":    {UID: "1.2.840.10008.5.1.4.1.1.88.76", Name: "Enhanced X-Ray Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.88.77":    {UID: "1.2.840.10008.5.1.4.1.1.88.77", Name: "Waveform Annotation SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.90.1":     {UID: "1.2.840.10008.5.1.4.1.1.90.1", Name: "Content Assessment Results Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.91.1":     {UID: "1.2.840.10008.5.1.4.1.1.91.1", Name: "Microscopy Bulk Simple Annotations Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.104.1":    {UID: "1.2.840.10008.5.1.4.1.1.104.1", Name: "Encapsulated PDF Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.104.2":    {UID: "1.2.840.10008.5.1.4.1.1.104.2", Name: "Encapsulated CDA Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.104.3":    {UID: "1.2.840.10008.5.1.4.1.1.104.3", Name: "Encapsulated STL Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.104.4":    {UID: "1.2.840.10008.5.1.4.1.1.104.4", Name: "Encapsulated OBJ Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.104.5":    {UID: "1.2.840.10008.5.1.4.1.1.104.5", Name: "Encapsulated MTL Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.128":      {UID: "1.2.840.10008.5.1.4.1.1.128", Name: "Positron Emission Tomography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.128.1":    {UID: "1.2.840.10008.5.1.4.1.1.128.1", Name: "Legacy Converted Enhanced PET Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.129":      {UID: "1.2.840.10008.5.1.4.1.1.129", Name: "Standalone PET Curve Storage", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.1.130":      {UID: "1.2.840.10008.5.1.4.1.1.130", Name: "Enhanced PET Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.131":      {UID: "1.2.840.10008.5.1.4.1.1.131", Name: "Basic Structured Display Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.1":    {UID: "1.2.840.10008.5.1.4.1.1.200.1", Name: "CT Defined Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.2":    {UID: "1.2.840.10008.5.1.4.1.1.200.2", Name: "CT Performed Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.3":    {UID: "1.2.840.10008.5.1.4.1.1.200.3", Name: "Protocol Approval Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.4":    {UID: "1.2.840.10008.5.1.4.1.1.200.4", Name: "Protocol Approval Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.5":    {UID: "1.2.840.10008.5.1.4.1.1.200.5", Name: "Protocol Approval Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.6":    {UID: "1.2.840.10008.5.1.4.1.1.200.6", Name: "Protocol Approval Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.7":    {UID: "1.2.840.10008.5.1.4.1.1.200.7", Name: "XA Defined Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.200.8":    {UID: "1.2.840.10008.5.1.4.1.1.200.8", Name: "XA Performed Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.201.1":    {UID: "1.2.840.10008.5.1.4.1.1.201.1", Name: "Inventory Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.201.2":    {UID: "1.2.840.10008.5.1.4.1.1.201.2", Name: "Inventory - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.201.3":    {UID: "1.2.840.10008.5.1.4.1.1.201.3", Name: "Inventory - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.201.4":    {UID: "1.2.840.10008.5.1.4.1.1.201.4", Name: "Inventory - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.201.5":    {UID: "1.2.840.10008.5.1.4.1.1.201.5", Name: "Inventory Creation", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.201.6":    {UID: "1.2.840.10008.5.1.4.1.1.201.6", Name: "Repository Query", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.201.1.1":  {UID: "1.2.840.10008.5.1.4.1.1.201.1.1", Name: "Storage Management SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.1":    {UID: "1.2.840.10008.5.1.4.1.1.481.1", Name: "RT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.2":    {UID: "1.2.840.10008.5.1.4.1.1.481.2", Name: "RT Dose Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.3":    {UID: "1.2.840.10008.5.1.4.1.1.481.3", Name: "RT Structure Set Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.4":    {UID: "1.2.840.10008.5.1.4.1.1.481.4", Name: "RT Beams Treatment Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.5":    {UID: "1.2.840.10008.5.1.4.1.1.481.5", Name: "RT Plan Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.6":    {UID: "1.2.840.10008.5.1.4.1.1.481.6", Name: "RT Brachy Treatment Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.7":    {UID: "1.2.840.10008.5.1.4.1.1.481.7", Name: "RT Treatment Summary Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.8":    {UID: "1.2.840.10008.5.1.4.1.1.481.8", Name: "RT Ion Plan Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.9":    {UID: "1.2.840.10008.5.1.4.1.1.481.9", Name: "RT Ion Beams Treatment Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.10":   {UID: "1.2.840.10008.5.1.4.1.1.481.10", Name: "RT Physician Intent Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.11":   {UID: "1.2.840.10008.5.1.4.1.1.481.11", Name: "RT Segment Annotation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.12":   {UID: "1.2.840.10008.5.1.4.1.1.481.12", Name: "RT Radiation Set Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.13":   {UID: "1.2.840.10008.5.1.4.1.1.481.13", Name: "C-Arm Photon-Electron Radiation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.14":   {UID: "1.2.840.10008.5.1.4.1.1.481.14", Name: "Tomotherapeutic Radiation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.15":   {UID: "1.2.840.10008.5.1.4.1.1.481.15", Name: "Robotic-Arm Radiation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.16":   {UID: "1.2.840.10008.5.1.4.1.1.481.16", Name: "RT Radiation Record Set Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.17":   {UID: "1.2.840.10008.5.1.4.1.1.481.17", Name: "RT Radiation Salvage Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.18":   {UID: "1.2.840.10008.5.1.4.1.1.481.18", Name: "Tomotherapeutic Radiation Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.19":   {UID: "1.2.840.10008.5.1.4.1.1.481.19", Name: "C-Arm Photon-Electron Radiation Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.20":   {UID: "1.2.840.10008.5.1.4.1.1.481.20", Name: "Robotic Radiation Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.21":   {UID: "1.2.840.10008.5.1.4.1.1.481.21", Name: "RT Radiation Set Delivery Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.22":   {UID: "1.2.840.10008.5.1.4.1.1.481.22", Name: "RT Treatment Preparation Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.23":   {UID: "1.2.840.10008.5.1.4.1.1.481.23", Name: "Enhanced RT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.24":   {UID: "1.2.840.10008.5.1.4.1.1.481.24", Name: "Enhanced Continuous RT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.481.25":   {UID: "1.2.840.10008.5.1.4.1.1.481.25", Name: "RT Patient Position Acquisition Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.501.1":    {UID: "1.2.840.10008.5.1.4.1.1.501.1", Name: "DICOS CT Image Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.501.2.1":  {UID: "1.2.840.10008.5.1.4.1.1.501.2.1", Name: "DICOS Digital X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "DICOS", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.501.2.2":  {UID: "1.2.840.10008.5.1.4.1.1.501.2.2", Name: "DICOS Digital X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "DICOS", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.501.3":    {UID: "1.2.840.10008.5.1.4.1.1.501.3", Name: "DICOS Threat Detection Report Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.501.4":    {UID: "1.2.840.10008.5.1.4.1.1.501.4", Name: "DICOS 2D AIT Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.501.5":    {UID: "1.2.840.10008.5.1.4.1.1.501.5", Name: "DICOS 3D AIT Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.501.6":    {UID: "1.2.840.10008.5.1.4.1.1.501.6", Name: "DICOS Quadrupole Resonance (QR) Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.601.1":    {UID: "1.2.840.10008.5.1.4.1.1.601.1", Name: "Eddy Current Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E2934", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.601.2":    {UID: "1.2.840.10008.5.1.4.1.1.601.2", Name: "Eddy Current Multi-frame Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E2934", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.601.3":    {UID: "1.2.840.10008.5.1.4.1.1.601.3", Name: "Thermography Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E3440", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.601.4":    {UID: "1.2.840.10008.5.1.4.1.1.601.4", Name: "Thermography Multi-frame Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E3440", Retired: false},
-	"1.2.840.10008.5.1.4.1.1.601.5":    {UID: "1.2.840.10008.5.1.4.1.1.601.5", Name: "Ultrasound Waveform Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E2663", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.1.1":      {UID: "1.2.840.10008.5.1.4.1.2.1.1", Name: "Patient Root Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.1.2":      {UID: "1.2.840.10008.5.1.4.1.2.1.2", Name: "Patient Root Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.1.3":      {UID: "1.2.840.10008.5.1.4.1.2.1.3", Name: "Patient Root Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.2.1":      {UID: "1.2.840.10008.5.1.4.1.2.2.1", Name: "Study Root Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.2.2":      {UID: "1.2.840.10008.5.1.4.1.2.2.2", Name: "Study Root Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.2.3":      {UID: "1.2.840.10008.5.1.4.1.2.2.3", Name: "Study Root Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.3.1":      {UID: "1.2.840.10008.5.1.4.1.2.3.1", Name: "Patient/Study Only Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.2.3.2":      {UID: "1.2.840.10008.5.1.4.1.2.3.2", Name: "Patient/Study Only Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.2.3.3":      {UID: "1.2.840.10008.5.1.4.1.2.3.3", Name: "Patient/Study Only Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.1.2.4.2":      {UID: "1.2.840.10008.5.1.4.1.2.4.2", Name: "Composite Instance Root Retrieve - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.4.3":      {UID: "1.2.840.10008.5.1.4.1.2.4.3", Name: "Composite Instance Root Retrieve - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.1.2.5.3":      {UID: "1.2.840.10008.5.1.4.1.2.5.3", Name: "Composite Instance Retrieve Without Bulk Data - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.20.1":         {UID: "1.2.840.10008.5.1.4.20.1", Name: "Defined Procedure Protocol Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.20.2":         {UID: "1.2.840.10008.5.1.4.20.2", Name: "Defined Procedure Protocol Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.20.3":         {UID: "1.2.840.10008.5.1.4.20.3", Name: "Defined Procedure Protocol Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.31":           {UID: "1.2.840.10008.5.1.4.31", Name: "Modality Worklist Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.32":           {UID: "1.2.840.10008.5.1.4.32", Name: "General Purpose Worklist Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.32.1":         {UID: "1.2.840.10008.5.1.4.32.1", Name: "General Purpose Worklist Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.32.2":         {UID: "1.2.840.10008.5.1.4.32.2", Name: "General Purpose Scheduled Procedure Step SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.32.3":         {UID: "1.2.840.10008.5.1.4.32.3", Name: "General Purpose Performed Procedure Step SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.33":           {UID: "1.2.840.10008.5.1.4.33", Name: "Instance Availability Notification SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.1":         {UID: "1.2.840.10008.5.1.4.34.1", Name: "RT Beams Delivery Instruction Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.2":         {UID: "1.2.840.10008.5.1.4.34.2", Name: "RT Conventional Machine Verification - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.3":         {UID: "1.2.840.10008.5.1.4.34.3", Name: "RT Ion Machine Verification - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.4":         {UID: "1.2.840.10008.5.1.4.34.4", Name: "Unified Worklist and Procedure Step Service Class - Trial", Type: TypeServiceClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.4.1":       {UID: "1.2.840.10008.5.1.4.34.4.1", Name: "Unified Procedure Step - Push SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.4.2":       {UID: "1.2.840.10008.5.1.4.34.4.2", Name: "Unified Procedure Step - Watch SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.4.3":       {UID: "1.2.840.10008.5.1.4.34.4.3", Name: "Unified Procedure Step - Pull SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.4.4":       {UID: "1.2.840.10008.5.1.4.34.4.4", Name: "Unified Procedure Step - Event SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
-	"1.2.840.10008.5.1.4.34.5":         {UID: "1.2.840.10008.5.1.4.34.5", Name: "UPS Global Subscription SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.5.1":       {UID: "1.2.840.10008.5.1.4.34.5.1", Name: "UPS Filtered Global Subscription SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.6":         {UID: "1.2.840.10008.5.1.4.34.6", Name: "Unified Worklist and Procedure Step Service Class", Type: TypeServiceClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.6.1":       {UID: "1.2.840.10008.5.1.4.34.6.1", Name: "Unified Procedure Step - Push SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.6.2":       {UID: "1.2.840.10008.5.1.4.34.6.2", Name: "Unified Procedure Step - Watch SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.6.3":       {UID: "1.2.840.10008.5.1.4.34.6.3", Name: "Unified Procedure Step - Pull SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.6.4":       {UID: "1.2.840.10008.5.1.4.34.6.4", Name: "Unified Procedure Step - Event SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.6.5":       {UID: "1.2.840.10008.5.1.4.34.6.5", Name: "Unified Procedure Step - Query SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.7":         {UID: "1.2.840.10008.5.1.4.34.7", Name: "RT Beams Delivery Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.8":         {UID: "1.2.840.10008.5.1.4.34.8", Name: "RT Conventional Machine Verification", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.9":         {UID: "1.2.840.10008.5.1.4.34.9", Name: "RT Ion Machine Verification", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.34.10":        {UID: "1.2.840.10008.5.1.4.34.10", Name: "RT Brachy Application Setup Delivery Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.37.1":         {UID: "1.2.840.10008.5.1.4.37.1", Name: "General Relevant Patient Information Query", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.37.2":         {UID: "1.2.840.10008.5.1.4.37.2", Name: "Breast Imaging Relevant Patient Information Query", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.37.3":         {UID: "1.2.840.10008.5.1.4.37.3", Name: "Cardiac Relevant Patient Information Query", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.38.1":         {UID: "1.2.840.10008.5.1.4.38.1", Name: "Hanging Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.38.2":         {UID: "1.2.840.10008.5.1.4.38.2", Name: "Hanging Protocol Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.38.3":         {UID: "1.2.840.10008.5.1.4.38.3", Name: "Hanging Protocol Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.38.4":         {UID: "1.2.840.10008.5.1.4.38.4", Name: "Hanging Protocol Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.39.1":         {UID: "1.2.840.10008.5.1.4.39.1", Name: "Color Palette Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.39.2":         {UID: "1.2.840.10008.5.1.4.39.2", Name: "Color Palette Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.39.3":         {UID: "1.2.840.10008.5.1.4.39.3", Name: "Color Palette Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.39.4":         {UID: "1.2.840.10008.5.1.4.39.4", Name: "Color Palette Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.41":           {UID: "1.2.840.10008.5.1.4.41", Name: "Product Characteristics Query SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.42":           {UID: "1.2.840.10008.5.1.4.42", Name: "Substance Approval Query SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.43.1":         {UID: "1.2.840.10008.5.1.4.43.1", Name: "Generic Implant Template Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.43.2":         {UID: "1.2.840.10008.5.1.4.43.2", Name: "Generic Implant Template Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.43.3":         {UID: "1.2.840.10008.5.1.4.43.3", Name: "Generic Implant Template Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.43.4":         {UID: "1.2.840.10008.5.1.4.43.4", Name: "Generic Implant Template Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.44.1":         {UID: "1.2.840.10008.5.1.4.44.1", Name: "Implant Assembly Template Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.44.2":         {UID: "1.2.840.10008.5.1.4.44.2", Name: "Implant Assembly Template Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.44.3":         {UID: "1.2.840.10008.5.1.4.44.3", Name: "Implant Assembly Template Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.44.4":         {UID: "1.2.840.10008.5.1.4.44.4", Name: "Implant Assembly Template Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.45.1":         {UID: "1.2.840.10008.5.1.4.45.1", Name: "Implant Template Group Storage", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.45.2":         {UID: "1.2.840.10008.5.1.4.45.2", Name: "Implant Template Group Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.45.3":         {UID: "1.2.840.10008.5.1.4.45.3", Name: "Implant Template Group Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.5.1.4.45.4":         {UID: "1.2.840.10008.5.1.4.45.4", Name: "Implant Template Group Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.7.1.1":              {UID: "1.2.840.10008.7.1.1", Name: "Native DICOM Model", Type: TypeApplicationHostingModel, Info: "", Retired: false},
-	"1.2.840.10008.7.1.2":              {UID: "1.2.840.10008.7.1.2", Name: "Abstract Multi-Dimensional Image Model", Type: TypeApplicationHostingModel, Info: "", Retired: false},
-	"1.2.840.10008.8.1.1":              {UID: "1.2.840.10008.8.1.1", Name: "DICOM Content Mapping Resource", Type: TypeMappingResource, Info: "", Retired: false},
-	"1.2.840.10008.10.1":               {UID: "1.2.840.10008.10.1", Name: "Video Endoscopic Image Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.10.2":               {UID: "1.2.840.10008.10.2", Name: "Video Photographic Image Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.10.3":               {UID: "1.2.840.10008.10.3", Name: "Audio Waveform Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.10.4":               {UID: "1.2.840.10008.10.4", Name: "Rendition Selection Document Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.1":           {UID: "1.2.840.10008.15.0.3.1", Name: "dicomDeviceName", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.2":           {UID: "1.2.840.10008.15.0.3.2", Name: "dicomDescription", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.3":           {UID: "1.2.840.10008.15.0.3.3", Name: "dicomManufacturer", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.4":           {UID: "1.2.840.10008.15.0.3.4", Name: "dicomManufacturerModelName", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.5":           {UID: "1.2.840.10008.15.0.3.5", Name: "dicomSoftwareVersion", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.6":           {UID: "1.2.840.10008.15.0.3.6", Name: "dicomVendorData", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.7":           {UID: "1.2.840.10008.15.0.3.7", Name: "dicomAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.8":           {UID: "1.2.840.10008.15.0.3.8", Name: "dicomNetworkConnectionReference", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.9":           {UID: "1.2.840.10008.15.0.3.9", Name: "dicomApplicationCluster", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.10":          {UID: "1.2.840.10008.15.0.3.10", Name: "dicomAssociationInitiator", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.11":          {UID: "1.2.840.10008.15.0.3.11", Name: "dicomAssociationAcceptor", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.12":          {UID: "1.2.840.10008.15.0.3.12", Name: "dicomHostname", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.13":          {UID: "1.2.840.10008.15.0.3.13", Name: "dicomPort", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.14":          {UID: "1.2.840.10008.15.0.3.14", Name: "dicomSOPClass", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.15":          {UID: "1.2.840.10008.15.0.3.15", Name: "dicomTransferRole", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.16":          {UID: "1.2.840.10008.15.0.3.16", Name: "dicomTransferSyntax", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.17":          {UID: "1.2.840.10008.15.0.3.17", Name: "dicomPrimaryDeviceType", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.18":          {UID: "1.2.840.10008.15.0.3.18", Name: "dicomRelatedDeviceReference", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.19":          {UID: "1.2.840.10008.15.0.3.19", Name: "dicomPreferredCalledAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.20":          {UID: "1.2.840.10008.15.0.3.20", Name: "dicomTLSCyphersuite", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.21":          {UID: "1.2.840.10008.15.0.3.21", Name: "dicomAuthorizedNodeCertificateReference", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.22":          {UID: "1.2.840.10008.15.0.3.22", Name: "dicomThisNodeCertificateReference", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.23":          {UID: "1.2.840.10008.15.0.3.23", Name: "dicomInstalled", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.24":          {UID: "1.2.840.10008.15.0.3.24", Name: "dicomStationName", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.25":          {UID: "1.2.840.10008.15.0.3.25", Name: "dicomDeviceSerialNumber", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.26":          {UID: "1.2.840.10008.15.0.3.26", Name: "dicomInstitutionName", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.27":          {UID: "1.2.840.10008.15.0.3.27", Name: "dicomInstitutionAddress", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.28":          {UID: "1.2.840.10008.15.0.3.28", Name: "dicomInstitutionDepartmentName", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.29":          {UID: "1.2.840.10008.15.0.3.29", Name: "dicomIssuerOfPatientID", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.30":          {UID: "1.2.840.10008.15.0.3.30", Name: "dicomPreferredCallingAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.3.31":          {UID: "1.2.840.10008.15.0.3.31", Name: "dicomSupportedCharacterSet", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.1":           {UID: "1.2.840.10008.15.0.4.1", Name: "dicomConfigurationRoot", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.2":           {UID: "1.2.840.10008.15.0.4.2", Name: "dicomDevicesRoot", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.3":           {UID: "1.2.840.10008.15.0.4.3", Name: "dicomUniqueAETitlesRegistryRoot", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.4":           {UID: "1.2.840.10008.15.0.4.4", Name: "dicomDevice", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.5":           {UID: "1.2.840.10008.15.0.4.5", Name: "dicomNetworkAE", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.6":           {UID: "1.2.840.10008.15.0.4.6", Name: "dicomNetworkConnection", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.7":           {UID: "1.2.840.10008.15.0.4.7", Name: "dicomUniqueAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.0.4.8":           {UID: "1.2.840.10008.15.0.4.8", Name: "dicomTransferCapability", Type: TypeLDAPOID, Info: "", Retired: false},
-	"1.2.840.10008.15.1.1":             {UID: "1.2.840.10008.15.1.1", Name: "Universal Coordinated Time", Type: TypeSynchronizationFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.1":            {UID: "1.2.840.10008.1.4.1.1", Name: "Talairach Brain Atlas Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.2":            {UID: "1.2.840.10008.1.4.1.2", Name: "SPM2 T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.3":            {UID: "1.2.840.10008.1.4.1.3", Name: "SPM2 T2 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.4":            {UID: "1.2.840.10008.1.4.1.4", Name: "SPM2 PD Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.5":            {UID: "1.2.840.10008.1.4.1.5", Name: "SPM2 EPI Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.6":            {UID: "1.2.840.10008.1.4.1.6", Name: "SPM2 FIL T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.7":            {UID: "1.2.840.10008.1.4.1.7", Name: "SPM2 PET Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.8":            {UID: "1.2.840.10008.1.4.1.8", Name: "SPM2 TRANSM Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.9":            {UID: "1.2.840.10008.1.4.1.9", Name: "SPM2 SPECT Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.10":           {UID: "1.2.840.10008.1.4.1.10", Name: "SPM2 GRAY Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.11":           {UID: "1.2.840.10008.1.4.1.11", Name: "SPM2 WHITE Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.12":           {UID: "1.2.840.10008.1.4.1.12", Name: "SPM2 CSF Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.13":           {UID: "1.2.840.10008.1.4.1.13", Name: "SPM2 BRAINMASK Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.14":           {UID: "1.2.840.10008.1.4.1.14", Name: "SPM2 AVG305T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.15":           {UID: "1.2.840.10008.1.4.1.15", Name: "SPM2 AVG152T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.16":           {UID: "1.2.840.10008.1.4.1.16", Name: "SPM2 AVG152T2 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.17":           {UID: "1.2.840.10008.1.4.1.17", Name: "SPM2 AVG152PD Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.1.18":           {UID: "1.2.840.10008.1.4.1.18", Name: "SPM2 SINGLESUBJT1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.2.1":            {UID: "1.2.840.10008.1.4.2.1", Name: "ICBM 452 T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.2.2":            {UID: "1.2.840.10008.1.4.2.2", Name: "ICBM Single Subject MRI Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.3.1":            {UID: "1.2.840.10008.1.4.3.1", Name: "IEC 61217 Fixed Coordinate System Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.3.2":            {UID: "1.2.840.10008.1.4.3.2", Name: "Standard Robotic-Arm Coordinate System Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.3.3":            {UID: "1.2.840.10008.1.4.3.3", Name: "IEC 61217 Table Top Coordinate System Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.4.1":            {UID: "1.2.840.10008.1.4.4.1", Name: "SRI24 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.5.1":            {UID: "1.2.840.10008.1.4.5.1", Name: "Colin27 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.6.1":            {UID: "1.2.840.10008.1.4.6.1", Name: "LPBA40/AIR Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.6.2":            {UID: "1.2.840.10008.1.4.6.2", Name: "LPBA40/FLIRT Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
-	"1.2.840.10008.1.4.6.3":            {UID: "1.2.840.10008.1.4.6.3", Name: "LPBA40/SPM5 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+// uidKeys contains the UIDs of all standard DICOM UIDs in sorted order.
+var uidKeys = [...]string{
+	"1.2.840.10008.1.1",
+	"1.2.840.10008.1.2",
+	"1.2.840.10008.1.2.1",
+	"1.2.840.10008.1.2.1.98",
+	"1.2.840.10008.1.2.1.99",
+	"1.2.840.10008.1.2.2",
+	"1.2.840.10008.1.2.4.100",
+	"1.2.840.10008.1.2.4.100.1",
+	"1.2.840.10008.1.2.4.101",
+	"1.2.840.10008.1.2.4.101.1",
+	"1.2.840.10008.1.2.4.102",
+	"1.2.840.10008.1.2.4.102.1",
+	"1.2.840.10008.1.2.4.103",
+	"1.2.840.10008.1.2.4.103.1",
+	"1.2.840.10008.1.2.4.104",
+	"1.2.840.10008.1.2.4.104.1",
+	"1.2.840.10008.1.2.4.105",
+	"1.2.840.10008.1.2.4.105.1",
+	"1.2.840.10008.1.2.4.106",
+	"1.2.840.10008.1.2.4.106.1",
+	"1.2.840.10008.1.2.4.107",
+	"1.2.840.10008.1.2.4.108",
+	"1.2.840.10008.1.2.4.110",
+	"1.2.840.10008.1.2.4.111",
+	"1.2.840.10008.1.2.4.112",
+	"1.2.840.10008.1.2.4.201",
+	"1.2.840.10008.1.2.4.202",
+	"1.2.840.10008.1.2.4.203",
+	"1.2.840.10008.1.2.4.204",
+	"1.2.840.10008.1.2.4.205",
+	"1.2.840.10008.1.2.4.50",
+	"1.2.840.10008.1.2.4.51",
+	"1.2.840.10008.1.2.4.52",
+	"1.2.840.10008.1.2.4.53",
+	"1.2.840.10008.1.2.4.54",
+	"1.2.840.10008.1.2.4.55",
+	"1.2.840.10008.1.2.4.56",
+	"1.2.840.10008.1.2.4.57",
+	"1.2.840.10008.1.2.4.58",
+	"1.2.840.10008.1.2.4.59",
+	"1.2.840.10008.1.2.4.60",
+	"1.2.840.10008.1.2.4.61",
+	"1.2.840.10008.1.2.4.62",
+	"1.2.840.10008.1.2.4.63",
+	"1.2.840.10008.1.2.4.64",
+	"1.2.840.10008.1.2.4.65",
+	"1.2.840.10008.1.2.4.66",
+	"1.2.840.10008.1.2.4.70",
+	"1.2.840.10008.1.2.4.80",
+	"1.2.840.10008.1.2.4.81",
+	"1.2.840.10008.1.2.4.90",
+	"1.2.840.10008.1.2.4.91",
+	"1.2.840.10008.1.2.4.92",
+	"1.2.840.10008.1.2.4.93",
+	"1.2.840.10008.1.2.4.94",
+	"1.2.840.10008.1.2.4.95",
+	"1.2.840.10008.1.2.5",
+	"1.2.840.10008.1.2.6.1",
+	"1.2.840.10008.1.2.6.2",
+	"1.2.840.10008.1.2.7.1",
+	"1.2.840.10008.1.2.7.2",
+	"1.2.840.10008.1.2.7.3",
+	"1.2.840.10008.1.2.8.1",
+	"1.2.840.10008.1.20",
+	"1.2.840.10008.1.20.1",
+	"1.2.840.10008.1.20.1.1",
+	"1.2.840.10008.1.20.2",
+	"1.2.840.10008.1.20.2.1",
+	"1.2.840.10008.1.3.10",
+	"1.2.840.10008.1.4.1.1",
+	"1.2.840.10008.1.4.1.10",
+	"1.2.840.10008.1.4.1.11",
+	"1.2.840.10008.1.4.1.12",
+	"1.2.840.10008.1.4.1.13",
+	"1.2.840.10008.1.4.1.14",
+	"1.2.840.10008.1.4.1.15",
+	"1.2.840.10008.1.4.1.16",
+	"1.2.840.10008.1.4.1.17",
+	"1.2.840.10008.1.4.1.18",
+	"1.2.840.10008.1.4.1.2",
+	"1.2.840.10008.1.4.1.3",
+	"1.2.840.10008.1.4.1.4",
+	"1.2.840.10008.1.4.1.5",
+	"1.2.840.10008.1.4.1.6",
+	"1.2.840.10008.1.4.1.7",
+	"1.2.840.10008.1.4.1.8",
+	"1.2.840.10008.1.4.1.9",
+	"1.2.840.10008.1.4.2.1",
+	"1.2.840.10008.1.4.2.2",
+	"1.2.840.10008.1.4.3.1",
+	"1.2.840.10008.1.4.3.2",
+	"1.2.840.10008.1.4.3.3",
+	"1.2.840.10008.1.4.4.1",
+	"1.2.840.10008.1.4.5.1",
+	"1.2.840.10008.1.4.6.1",
+	"1.2.840.10008.1.4.6.2",
+	"1.2.840.10008.1.4.6.3",
+	"1.2.840.10008.1.40",
+	"1.2.840.10008.1.40.1",
+	"1.2.840.10008.1.42",
+	"1.2.840.10008.1.42.1",
+	"1.2.840.10008.1.5.1",
+	"1.2.840.10008.1.5.2",
+	"1.2.840.10008.1.5.3",
+	"1.2.840.10008.1.5.4",
+	"1.2.840.10008.1.5.5",
+	"1.2.840.10008.1.5.6",
+	"1.2.840.10008.1.5.7",
+	"1.2.840.10008.1.5.8",
+	"1.2.840.10008.1.9",
+	"1.2.840.10008.10.1",
+	"1.2.840.10008.10.2",
+	"1.2.840.10008.10.3",
+	"1.2.840.10008.10.4",
+	"1.2.840.10008.15.0.3.1",
+	"1.2.840.10008.15.0.3.10",
+	"1.2.840.10008.15.0.3.11",
+	"1.2.840.10008.15.0.3.12",
+	"1.2.840.10008.15.0.3.13",
+	"1.2.840.10008.15.0.3.14",
+	"1.2.840.10008.15.0.3.15",
+	"1.2.840.10008.15.0.3.16",
+	"1.2.840.10008.15.0.3.17",
+	"1.2.840.10008.15.0.3.18",
+	"1.2.840.10008.15.0.3.19",
+	"1.2.840.10008.15.0.3.2",
+	"1.2.840.10008.15.0.3.20",
+	"1.2.840.10008.15.0.3.21",
+	"1.2.840.10008.15.0.3.22",
+	"1.2.840.10008.15.0.3.23",
+	"1.2.840.10008.15.0.3.24",
+	"1.2.840.10008.15.0.3.25",
+	"1.2.840.10008.15.0.3.26",
+	"1.2.840.10008.15.0.3.27",
+	"1.2.840.10008.15.0.3.28",
+	"1.2.840.10008.15.0.3.29",
+	"1.2.840.10008.15.0.3.3",
+	"1.2.840.10008.15.0.3.30",
+	"1.2.840.10008.15.0.3.31",
+	"1.2.840.10008.15.0.3.4",
+	"1.2.840.10008.15.0.3.5",
+	"1.2.840.10008.15.0.3.6",
+	"1.2.840.10008.15.0.3.7",
+	"1.2.840.10008.15.0.3.8",
+	"1.2.840.10008.15.0.3.9",
+	"1.2.840.10008.15.0.4.1",
+	"1.2.840.10008.15.0.4.2",
+	"1.2.840.10008.15.0.4.3",
+	"1.2.840.10008.15.0.4.4",
+	"1.2.840.10008.15.0.4.5",
+	"1.2.840.10008.15.0.4.6",
+	"1.2.840.10008.15.0.4.7",
+	"1.2.840.10008.15.0.4.8",
+	"1.2.840.10008.15.1.1",
+	"1.2.840.10008.2.16.10",
+	"1.2.840.10008.2.16.11",
+	"1.2.840.10008.2.16.12",
+	"1.2.840.10008.2.16.13",
+	"1.2.840.10008.2.16.14",
+	"1.2.840.10008.2.16.15",
+	"1.2.840.10008.2.16.16",
+	"1.2.840.10008.2.16.17",
+	"1.2.840.10008.2.16.18",
+	"1.2.840.10008.2.16.4",
+	"1.2.840.10008.2.16.5",
+	"1.2.840.10008.2.16.6",
+	"1.2.840.10008.2.16.7",
+	"1.2.840.10008.2.16.8",
+	"1.2.840.10008.2.16.9",
+	"1.2.840.10008.2.6.1",
+	"1.2.840.10008.3.1.1.1",
+	"1.2.840.10008.3.1.2.1.1",
+	"1.2.840.10008.3.1.2.1.4",
+	"1.2.840.10008.3.1.2.2.1",
+	"1.2.840.10008.3.1.2.3.1",
+	"1.2.840.10008.3.1.2.3.2",
+	"1.2.840.10008.3.1.2.3.3",
+	"1.2.840.10008.3.1.2.3.4",
+	"1.2.840.10008.3.1.2.3.5",
+	"1.2.840.10008.3.1.2.5.1",
+	"1.2.840.10008.3.1.2.5.4",
+	"1.2.840.10008.3.1.2.5.5",
+	"1.2.840.10008.3.1.2.6.1",
+	"1.2.840.10008.4.2",
+	"1.2.840.10008.5.1.1.1",
+	"1.2.840.10008.5.1.1.14",
+	"1.2.840.10008.5.1.1.15",
+	"1.2.840.10008.5.1.1.16",
+	"1.2.840.10008.5.1.1.16.376",
+	"1.2.840.10008.5.1.1.17",
+	"1.2.840.10008.5.1.1.17.376",
+	"1.2.840.10008.5.1.1.18",
+	"1.2.840.10008.5.1.1.18.1",
+	"1.2.840.10008.5.1.1.2",
+	"1.2.840.10008.5.1.1.22",
+	"1.2.840.10008.5.1.1.23",
+	"1.2.840.10008.5.1.1.24",
+	"1.2.840.10008.5.1.1.24.1",
+	"1.2.840.10008.5.1.1.25",
+	"1.2.840.10008.5.1.1.26",
+	"1.2.840.10008.5.1.1.27",
+	"1.2.840.10008.5.1.1.29",
+	"1.2.840.10008.5.1.1.30",
+	"1.2.840.10008.5.1.1.31",
+	"1.2.840.10008.5.1.1.32",
+	"1.2.840.10008.5.1.1.33",
+	"1.2.840.10008.5.1.1.4",
+	"1.2.840.10008.5.1.1.4.1",
+	"1.2.840.10008.5.1.1.4.2",
+	"1.2.840.10008.5.1.1.40",
+	"1.2.840.10008.5.1.1.40.1",
+	"1.2.840.10008.5.1.1.9",
+	"1.2.840.10008.5.1.1.9.1",
+	"1.2.840.10008.5.1.4.1.1.1",
+	"1.2.840.10008.5.1.4.1.1.1.1",
+	"1.2.840.10008.5.1.4.1.1.1.1.1",
+	"1.2.840.10008.5.1.4.1.1.1.2",
+	"1.2.840.10008.5.1.4.1.1.1.2.1",
+	"1.2.840.10008.5.1.4.1.1.1.3",
+	"1.2.840.10008.5.1.4.1.1.1.3.1",
+	"1.2.840.10008.5.1.4.1.1.10",
+	"1.2.840.10008.5.1.4.1.1.104.1",
+	"1.2.840.10008.5.1.4.1.1.104.2",
+	"1.2.840.10008.5.1.4.1.1.104.3",
+	"1.2.840.10008.5.1.4.1.1.104.4",
+	"1.2.840.10008.5.1.4.1.1.104.5",
+	"1.2.840.10008.5.1.4.1.1.11",
+	"1.2.840.10008.5.1.4.1.1.11.1",
+	"1.2.840.10008.5.1.4.1.1.11.10",
+	"1.2.840.10008.5.1.4.1.1.11.11",
+	"1.2.840.10008.5.1.4.1.1.11.12",
+	"1.2.840.10008.5.1.4.1.1.11.2",
+	"1.2.840.10008.5.1.4.1.1.11.3",
+	"1.2.840.10008.5.1.4.1.1.11.4",
+	"1.2.840.10008.5.1.4.1.1.11.5",
+	"1.2.840.10008.5.1.4.1.1.11.6",
+	"1.2.840.10008.5.1.4.1.1.11.7",
+	"1.2.840.10008.5.1.4.1.1.11.8",
+	"1.2.840.10008.5.1.4.1.1.11.9",
+	"1.2.840.10008.5.1.4.1.1.12.1",
+	"1.2.840.10008.5.1.4.1.1.12.1.1",
+	"1.2.840.10008.5.1.4.1.1.12.2",
+	"1.2.840.10008.5.1.4.1.1.12.2.1",
+	"1.2.840.10008.5.1.4.1.1.12.3",
+	"1.2.840.10008.5.1.4.1.1.12.77",
+	"1.2.840.10008.5.1.4.1.1.128",
+	"1.2.840.10008.5.1.4.1.1.128.1",
+	"1.2.840.10008.5.1.4.1.1.129",
+	"1.2.840.10008.5.1.4.1.1.13.1.1",
+	"1.2.840.10008.5.1.4.1.1.13.1.2",
+	"1.2.840.10008.5.1.4.1.1.13.1.3",
+	"1.2.840.10008.5.1.4.1.1.13.1.4",
+	"1.2.840.10008.5.1.4.1.1.13.1.5",
+	"1.2.840.10008.5.1.4.1.1.130",
+	"1.2.840.10008.5.1.4.1.1.131",
+	"1.2.840.10008.5.1.4.1.1.14.1",
+	"1.2.840.10008.5.1.4.1.1.14.2",
+	"1.2.840.10008.5.1.4.1.1.2",
+	"1.2.840.10008.5.1.4.1.1.2.1",
+	"1.2.840.10008.5.1.4.1.1.2.2",
+	"1.2.840.10008.5.1.4.1.1.20",
+	"1.2.840.10008.5.1.4.1.1.200.1",
+	"1.2.840.10008.5.1.4.1.1.200.2",
+	"1.2.840.10008.5.1.4.1.1.200.3",
+	"1.2.840.10008.5.1.4.1.1.200.4",
+	"1.2.840.10008.5.1.4.1.1.200.5",
+	"1.2.840.10008.5.1.4.1.1.200.6",
+	"1.2.840.10008.5.1.4.1.1.200.7",
+	"1.2.840.10008.5.1.4.1.1.200.8",
+	"1.2.840.10008.5.1.4.1.1.201.1",
+	"1.2.840.10008.5.1.4.1.1.201.1.1",
+	"1.2.840.10008.5.1.4.1.1.201.2",
+	"1.2.840.10008.5.1.4.1.1.201.3",
+	"1.2.840.10008.5.1.4.1.1.201.4",
+	"1.2.840.10008.5.1.4.1.1.201.5",
+	"1.2.840.10008.5.1.4.1.1.201.6",
+	"1.2.840.10008.5.1.4.1.1.3",
+	"1.2.840.10008.5.1.4.1.1.3.1",
+	"1.2.840.10008.5.1.4.1.1.30",
+	"1.2.840.10008.5.1.4.1.1.4",
+	"1.2.840.10008.5.1.4.1.1.4.1",
+	"1.2.840.10008.5.1.4.1.1.4.2",
+	"1.2.840.10008.5.1.4.1.1.4.3",
+	"1.2.840.10008.5.1.4.1.1.4.4",
+	"1.2.840.10008.5.1.4.1.1.40",
+	"1.2.840.10008.5.1.4.1.1.481.1",
+	"1.2.840.10008.5.1.4.1.1.481.10",
+	"1.2.840.10008.5.1.4.1.1.481.11",
+	"1.2.840.10008.5.1.4.1.1.481.12",
+	"1.2.840.10008.5.1.4.1.1.481.13",
+	"1.2.840.10008.5.1.4.1.1.481.14",
+	"1.2.840.10008.5.1.4.1.1.481.15",
+	"1.2.840.10008.5.1.4.1.1.481.16",
+	"1.2.840.10008.5.1.4.1.1.481.17",
+	"1.2.840.10008.5.1.4.1.1.481.18",
+	"1.2.840.10008.5.1.4.1.1.481.19",
+	"1.2.840.10008.5.1.4.1.1.481.2",
+	"1.2.840.10008.5.1.4.1.1.481.20",
+	"1.2.840.10008.5.1.4.1.1.481.21",
+	"1.2.840.10008.5.1.4.1.1.481.22",
+	"1.2.840.10008.5.1.4.1.1.481.23",
+	"1.2.840.10008.5.1.4.1.1.481.24",
+	"1.2.840.10008.5.1.4.1.1.481.25",
+	"1.2.840.10008.5.1.4.1.1.481.3",
+	"1.2.840.10008.5.1.4.1.1.481.4",
+	"1.2.840.10008.5.1.4.1.1.481.5",
+	"1.2.840.10008.5.1.4.1.1.481.6",
+	"1.2.840.10008.5.1.4.1.1.481.7",
+	"1.2.840.10008.5.1.4.1.1.481.8",
+	"1.2.840.10008.5.1.4.1.1.481.9",
+	"1.2.840.10008.5.1.4.1.1.5",
+	"1.2.840.10008.5.1.4.1.1.501.1",
+	"1.2.840.10008.5.1.4.1.1.501.2.1",
+	"1.2.840.10008.5.1.4.1.1.501.2.2",
+	"1.2.840.10008.5.1.4.1.1.501.3",
+	"1.2.840.10008.5.1.4.1.1.501.4",
+	"1.2.840.10008.5.1.4.1.1.501.5",
+	"1.2.840.10008.5.1.4.1.1.501.6",
+	"1.2.840.10008.5.1.4.1.1.6",
+	"1.2.840.10008.5.1.4.1.1.6.1",
+	"1.2.840.10008.5.1.4.1.1.6.2",
+	"1.2.840.10008.5.1.4.1.1.6.3",
+	"1.2.840.10008.5.1.4.1.1.601.1",
+	"1.2.840.10008.5.1.4.1.1.601.2",
+	"1.2.840.10008.5.1.4.1.1.601.3",
+	"1.2.840.10008.5.1.4.1.1.601.4",
+	"1.2.840.10008.5.1.4.1.1.601.5",
+	"1.2.840.10008.5.1.4.1.1.66",
+	"1.2.840.10008.5.1.4.1.1.66.1",
+	"1.2.840.10008.5.1.4.1.1.66.2",
+	"1.2.840.10008.5.1.4.1.1.66.3",
+	"1.2.840.10008.5.1.4.1.1.66.4",
+	"1.2.840.10008.5.1.4.1.1.66.5",
+	"1.2.840.10008.5.1.4.1.1.66.6",
+	"1.2.840.10008.5.1.4.1.1.66.7",
+	"1.2.840.10008.5.1.4.1.1.66.8",
+	"1.2.840.10008.5.1.4.1.1.67",
+	"1.2.840.10008.5.1.4.1.1.68.1",
+	"1.2.840.10008.5.1.4.1.1.68.2",
+	"1.2.840.10008.5.1.4.1.1.7",
+	"1.2.840.10008.5.1.4.1.1.7.1",
+	"1.2.840.10008.5.1.4.1.1.7.2",
+	"1.2.840.10008.5.1.4.1.1.7.3",
+	"1.2.840.10008.5.1.4.1.1.7.4",
+	"1.2.840.10008.5.1.4.1.1.77.1",
+	"1.2.840.10008.5.1.4.1.1.77.1.1",
+	"1.2.840.10008.5.1.4.1.1.77.1.1.1",
+	"1.2.840.10008.5.1.4.1.1.77.1.2",
+	"1.2.840.10008.5.1.4.1.1.77.1.2.1",
+	"1.2.840.10008.5.1.4.1.1.77.1.3",
+	"1.2.840.10008.5.1.4.1.1.77.1.4",
+	"1.2.840.10008.5.1.4.1.1.77.1.4.1",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.1",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.2",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.3",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.4",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.5",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.6",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.7",
+	"1.2.840.10008.5.1.4.1.1.77.1.5.8",
+	"1.2.840.10008.5.1.4.1.1.77.1.6",
+	"1.2.840.10008.5.1.4.1.1.77.1.7",
+	"1.2.840.10008.5.1.4.1.1.77.1.8",
+	"1.2.840.10008.5.1.4.1.1.77.1.9",
+	"1.2.840.10008.5.1.4.1.1.77.2",
+	"1.2.840.10008.5.1.4.1.1.78.1",
+	"1.2.840.10008.5.1.4.1.1.78.2",
+	"1.2.840.10008.5.1.4.1.1.78.3",
+	"1.2.840.10008.5.1.4.1.1.78.4",
+	"1.2.840.10008.5.1.4.1.1.78.5",
+	"1.2.840.10008.5.1.4.1.1.78.6",
+	"1.2.840.10008.5.1.4.1.1.78.7",
+	"1.2.840.10008.5.1.4.1.1.78.8",
+	"1.2.840.10008.5.1.4.1.1.79.1",
+	"1.2.840.10008.5.1.4.1.1.8",
+	"1.2.840.10008.5.1.4.1.1.80.1",
+	"1.2.840.10008.5.1.4.1.1.81.1",
+	"1.2.840.10008.5.1.4.1.1.82.1",
+	"1.2.840.10008.5.1.4.1.1.88.1",
+	"1.2.840.10008.5.1.4.1.1.88.11",
+	"1.2.840.10008.5.1.4.1.1.88.2",
+	"1.2.840.10008.5.1.4.1.1.88.22",
+	"1.2.840.10008.5.1.4.1.1.88.3",
+	"1.2.840.10008.5.1.4.1.1.88.33",
+	"1.2.840.10008.5.1.4.1.1.88.34",
+	"1.2.840.10008.5.1.4.1.1.88.35",
+	"1.2.840.10008.5.1.4.1.1.88.4",
+	"1.2.840.10008.5.1.4.1.1.88.40",
+	"1.2.840.10008.5.1.4.1.1.88.50",
+	"1.2.840.10008.5.1.4.1.1.88.59",
+	"1.2.840.10008.5.1.4.1.1.88.65",
+	"1.2.840.10008.5.1.4.1.1.88.67",
+	"1.2.840.10008.5.1.4.1.1.88.68",
+	"1.2.840.10008.5.1.4.1.1.88.69",
+	"1.2.840.10008.5.1.4.1.1.88.70",
+	"1.2.840.10008.5.1.4.1.1.88.71",
+	"1.2.840.10008.5.1.4.1.1.88.72",
+	"1.2.840.10008.5.1.4.1.1.88.73",
+	"1.2.840.10008.5.1.4.1.1.88.74",
+	"1.2.840.10008.5.1.4.1.1.88.75",
+	"1.2.840.10008.5.1.4.1.1.88.76",
+	"1.2.840.10008.5.1.4.1.1.88.77",
+	"1.2.840.10008.5.1.4.1.1.9",
+	"1.2.840.10008.5.1.4.1.1.9.1",
+	"1.2.840.10008.5.1.4.1.1.9.1.1",
+	"1.2.840.10008.5.1.4.1.1.9.1.2",
+	"1.2.840.10008.5.1.4.1.1.9.1.3",
+	"1.2.840.10008.5.1.4.1.1.9.1.4",
+	"1.2.840.10008.5.1.4.1.1.9.100.1",
+	"1.2.840.10008.5.1.4.1.1.9.100.2",
+	"1.2.840.10008.5.1.4.1.1.9.2.1",
+	"1.2.840.10008.5.1.4.1.1.9.3.1",
+	"1.2.840.10008.5.1.4.1.1.9.4.1",
+	"1.2.840.10008.5.1.4.1.1.9.4.2",
+	"1.2.840.10008.5.1.4.1.1.9.5.1",
+	"1.2.840.10008.5.1.4.1.1.9.6.1",
+	"1.2.840.10008.5.1.4.1.1.9.6.2",
+	"1.2.840.10008.5.1.4.1.1.9.7.1",
+	"1.2.840.10008.5.1.4.1.1.9.7.2",
+	"1.2.840.10008.5.1.4.1.1.9.7.3",
+	"1.2.840.10008.5.1.4.1.1.9.7.4",
+	"1.2.840.10008.5.1.4.1.1.9.8.1",
+	"1.2.840.10008.5.1.4.1.1.90.1",
+	"1.2.840.10008.5.1.4.1.1.91.1",
+	"1.2.840.10008.5.1.4.1.2.1.1",
+	"1.2.840.10008.5.1.4.1.2.1.2",
+	"1.2.840.10008.5.1.4.1.2.1.3",
+	"1.2.840.10008.5.1.4.1.2.2.1",
+	"1.2.840.10008.5.1.4.1.2.2.2",
+	"1.2.840.10008.5.1.4.1.2.2.3",
+	"1.2.840.10008.5.1.4.1.2.3.1",
+	"1.2.840.10008.5.1.4.1.2.3.2",
+	"1.2.840.10008.5.1.4.1.2.3.3",
+	"1.2.840.10008.5.1.4.1.2.4.2",
+	"1.2.840.10008.5.1.4.1.2.4.3",
+	"1.2.840.10008.5.1.4.1.2.5.3",
+	"1.2.840.10008.5.1.4.20.1",
+	"1.2.840.10008.5.1.4.20.2",
+	"1.2.840.10008.5.1.4.20.3",
+	"1.2.840.10008.5.1.4.31",
+	"1.2.840.10008.5.1.4.32",
+	"1.2.840.10008.5.1.4.32.1",
+	"1.2.840.10008.5.1.4.32.2",
+	"1.2.840.10008.5.1.4.32.3",
+	"1.2.840.10008.5.1.4.33",
+	"1.2.840.10008.5.1.4.34.1",
+	"1.2.840.10008.5.1.4.34.10",
+	"1.2.840.10008.5.1.4.34.2",
+	"1.2.840.10008.5.1.4.34.3",
+	"1.2.840.10008.5.1.4.34.4",
+	"1.2.840.10008.5.1.4.34.4.1",
+	"1.2.840.10008.5.1.4.34.4.2",
+	"1.2.840.10008.5.1.4.34.4.3",
+	"1.2.840.10008.5.1.4.34.4.4",
+	"1.2.840.10008.5.1.4.34.5",
+	"1.2.840.10008.5.1.4.34.5.1",
+	"1.2.840.10008.5.1.4.34.6",
+	"1.2.840.10008.5.1.4.34.6.1",
+	"1.2.840.10008.5.1.4.34.6.2",
+	"1.2.840.10008.5.1.4.34.6.3",
+	"1.2.840.10008.5.1.4.34.6.4",
+	"1.2.840.10008.5.1.4.34.6.5",
+	"1.2.840.10008.5.1.4.34.7",
+	"1.2.840.10008.5.1.4.34.8",
+	"1.2.840.10008.5.1.4.34.9",
+	"1.2.840.10008.5.1.4.37.1",
+	"1.2.840.10008.5.1.4.37.2",
+	"1.2.840.10008.5.1.4.37.3",
+	"1.2.840.10008.5.1.4.38.1",
+	"1.2.840.10008.5.1.4.38.2",
+	"1.2.840.10008.5.1.4.38.3",
+	"1.2.840.10008.5.1.4.38.4",
+	"1.2.840.10008.5.1.4.39.1",
+	"1.2.840.10008.5.1.4.39.2",
+	"1.2.840.10008.5.1.4.39.3",
+	"1.2.840.10008.5.1.4.39.4",
+	"1.2.840.10008.5.1.4.41",
+	"1.2.840.10008.5.1.4.42",
+	"1.2.840.10008.5.1.4.43.1",
+	"1.2.840.10008.5.1.4.43.2",
+	"1.2.840.10008.5.1.4.43.3",
+	"1.2.840.10008.5.1.4.43.4",
+	"1.2.840.10008.5.1.4.44.1",
+	"1.2.840.10008.5.1.4.44.2",
+	"1.2.840.10008.5.1.4.44.3",
+	"1.2.840.10008.5.1.4.44.4",
+	"1.2.840.10008.5.1.4.45.1",
+	"1.2.840.10008.5.1.4.45.2",
+	"1.2.840.10008.5.1.4.45.3",
+	"1.2.840.10008.5.1.4.45.4",
+	"1.2.840.10008.7.1.1",
+	"1.2.840.10008.7.1.2",
+	"1.2.840.10008.8.1.1",
+}
+
+// uidTable contains metadata for all standard DICOM UIDs, indexed in step with uidKeys.
+var uidTable = [...]Info{
+	{UID: "1.2.840.10008.1.1", Name: "Verification SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2", Name: "Implicit VR Little Endian", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for DICOM", Retired: false},
+	{UID: "1.2.840.10008.1.2.1", Name: "Explicit VR Little Endian", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.1.98", Name: "Encapsulated Uncompressed Explicit VR Little Endian", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.1.99", Name: "Deflated Explicit VR Little Endian", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.2", Name: "Explicit VR Big Endian", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.100", Name: "MPEG2 Main Profile / Main Level", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.100.1", Name: "Fragmentable MPEG2 Main Profile / Main Level", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.101", Name: "MPEG2 Main Profile / High Level", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.101.1", Name: "Fragmentable MPEG2 Main Profile / High Level", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.102", Name: "MPEG-4 AVC/H.264 High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.102.1", Name: "Fragmentable MPEG-4 AVC/H.264 High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.103", Name: "MPEG-4 AVC/H.264 BD-compatible High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.103.1", Name: "Fragmentable MPEG-4 AVC/H.264 BD-compatible High Profile / Level 4.1", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.104", Name: "MPEG-4 AVC/H.264 High Profile / Level 4.2 For 2D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.104.1", Name: "Fragmentable MPEG-4 AVC/H.264 High Profile / Level 4.2 For 2D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.105", Name: "MPEG-4 AVC/H.264 High Profile / Level 4.2 For 3D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.105.1", Name: "Fragmentable MPEG-4 AVC/H.264 High Profile / Level 4.2 For 3D Video", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.106", Name: "MPEG-4 AVC/H.264 Stereo High Profile / Level 4.2", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.106.1", Name: "Fragmentable MPEG-4 AVC/H.264 Stereo High Profile / Level 4.2", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.107", Name: "HEVC/H.265 Main Profile / Level 5.1", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.108", Name: "HEVC/H.265 Main 10 Profile / Level 5.1", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.110", Name: "JPEG XL Lossless", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.111", Name: "JPEG XL JPEG Recompression", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.112", Name: "JPEG XL", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.201", Name: "High-Throughput JPEG 2000 Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.202", Name: "High-Throughput JPEG 2000 with RPCL Options Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.203", Name: "High-Throughput JPEG 2000 Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.204", Name: "JPIP HTJ2K Referenced", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.205", Name: "JPIP HTJ2K Referenced Deflate", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.50", Name: "JPEG Baseline (Process 1)", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for Lossy JPEG 8 Bit Image Compression", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.51", Name: "JPEG Extended (Process 2 and 4)", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for Lossy JPEG 12 Bit Image Compression (Process 4 only)", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.52", Name: "JPEG Extended (Process 3 and 5)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.53", Name: "JPEG Spectral Selection, Non-Hierarchical (Process 6 and 8)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.54", Name: "JPEG Spectral Selection, Non-Hierarchical (Process 7 and 9)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.55", Name: "JPEG Full Progression, Non-Hierarchical (Process 10 and 12)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.56", Name: "JPEG Full Progression, Non-Hierarchical (Process 11 and 13)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.57", Name: "JPEG Lossless, Non-Hierarchical (Process 14)", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.58", Name: "JPEG Lossless, Non-Hierarchical (Process 15)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.59", Name: "JPEG Extended, Hierarchical (Process 16 and 18)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.60", Name: "JPEG Extended, Hierarchical (Process 17 and 19)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.61", Name: "JPEG Spectral Selection, Hierarchical (Process 20 and 22)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.62", Name: "JPEG Spectral Selection, Hierarchical (Process 21 and 23)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.63", Name: "JPEG Full Progression, Hierarchical (Process 24 and 26)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.64", Name: "JPEG Full Progression, Hierarchical (Process 25 and 27)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.65", Name: "JPEG Lossless, Hierarchical (Process 28)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.66", Name: "JPEG Lossless, Hierarchical (Process 29)", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.4.70", Name: "JPEG Lossless, Non-Hierarchical, First-Order Prediction (Process 14 [Selection Value 1])", Type: TypeTransferSyntax, Info: "Default Transfer Syntax for Lossless JPEG Image Compression", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.80", Name: "JPEG-LS Lossless Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.81", Name: "JPEG-LS Lossy (Near-Lossless) Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.90", Name: "JPEG 2000 Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.91", Name: "JPEG 2000 Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.92", Name: "JPEG 2000 Part 2 Multi-component Image Compression (Lossless Only)", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.93", Name: "JPEG 2000 Part 2 Multi-component Image Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.94", Name: "JPIP Referenced", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.4.95", Name: "JPIP Referenced Deflate", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.5", Name: "RLE Lossless", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.6.1", Name: "RFC 2557 MIME encapsulation", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.6.2", Name: "XML Encoding", Type: TypeTransferSyntax, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.2.7.1", Name: "SMPTE ST 2110-20 Uncompressed Progressive Active Video", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.7.2", Name: "SMPTE ST 2110-20 Uncompressed Interlaced Active Video", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.7.3", Name: "SMPTE ST 2110-30 PCM Digital Audio", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.2.8.1", Name: "Deflated Image Frame Compression", Type: TypeTransferSyntax, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.20", Name: "Papyrus 3 Implicit VR Little Endian", Type: TypeTransferSyntax, Info: "(2015c)", Retired: true},
+	{UID: "1.2.840.10008.1.20.1", Name: "Storage Commitment Push Model SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.20.1.1", Name: "Storage Commitment Push Model SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.20.2", Name: "Storage Commitment Pull Model SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.20.2.1", Name: "Storage Commitment Pull Model SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: true},
+	{UID: "1.2.840.10008.1.3.10", Name: "Media Storage Directory Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.1", Name: "Talairach Brain Atlas Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.10", Name: "SPM2 GRAY Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.11", Name: "SPM2 WHITE Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.12", Name: "SPM2 CSF Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.13", Name: "SPM2 BRAINMASK Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.14", Name: "SPM2 AVG305T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.15", Name: "SPM2 AVG152T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.16", Name: "SPM2 AVG152T2 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.17", Name: "SPM2 AVG152PD Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.18", Name: "SPM2 SINGLESUBJT1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.2", Name: "SPM2 T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.3", Name: "SPM2 T2 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.4", Name: "SPM2 PD Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.5", Name: "SPM2 EPI Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.6", Name: "SPM2 FIL T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.7", Name: "SPM2 PET Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.8", Name: "SPM2 TRANSM Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.1.9", Name: "SPM2 SPECT Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.2.1", Name: "ICBM 452 T1 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.2.2", Name: "ICBM Single Subject MRI Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.3.1", Name: "IEC 61217 Fixed Coordinate System Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.3.2", Name: "Standard Robotic-Arm Coordinate System Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.3.3", Name: "IEC 61217 Table Top Coordinate System Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.4.1", Name: "SRI24 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.5.1", Name: "Colin27 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.6.1", Name: "LPBA40/AIR Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.6.2", Name: "LPBA40/FLIRT Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.4.6.3", Name: "LPBA40/SPM5 Frame of Reference", Type: TypeWellKnownFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.40", Name: "Procedural Event Logging SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.40.1", Name: "Procedural Event Logging SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.42", Name: "Substance Administration Logging SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.42.1", Name: "Substance Administration Logging SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.1", Name: "Hot Iron Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.2", Name: "PET Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.3", Name: "Hot Metal Blue Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.4", Name: "PET 20 Step Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.5", Name: "Spring Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.6", Name: "Summer Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.7", Name: "Fall Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.5.8", Name: "Winter Color Palette SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.1.9", Name: "Basic Study Content Notification SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.10.1", Name: "Video Endoscopic Image Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.10.2", Name: "Video Photographic Image Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.10.3", Name: "Audio Waveform Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.10.4", Name: "Rendition Selection Document Real-Time Communication", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.1", Name: "dicomDeviceName", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.10", Name: "dicomAssociationInitiator", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.11", Name: "dicomAssociationAcceptor", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.12", Name: "dicomHostname", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.13", Name: "dicomPort", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.14", Name: "dicomSOPClass", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.15", Name: "dicomTransferRole", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.16", Name: "dicomTransferSyntax", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.17", Name: "dicomPrimaryDeviceType", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.18", Name: "dicomRelatedDeviceReference", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.19", Name: "dicomPreferredCalledAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.2", Name: "dicomDescription", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.20", Name: "dicomTLSCyphersuite", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.21", Name: "dicomAuthorizedNodeCertificateReference", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.22", Name: "dicomThisNodeCertificateReference", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.23", Name: "dicomInstalled", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.24", Name: "dicomStationName", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.25", Name: "dicomDeviceSerialNumber", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.26", Name: "dicomInstitutionName", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.27", Name: "dicomInstitutionAddress", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.28", Name: "dicomInstitutionDepartmentName", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.29", Name: "dicomIssuerOfPatientID", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.3", Name: "dicomManufacturer", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.30", Name: "dicomPreferredCallingAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.31", Name: "dicomSupportedCharacterSet", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.4", Name: "dicomManufacturerModelName", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.5", Name: "dicomSoftwareVersion", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.6", Name: "dicomVendorData", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.7", Name: "dicomAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.8", Name: "dicomNetworkConnectionReference", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.3.9", Name: "dicomApplicationCluster", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.1", Name: "dicomConfigurationRoot", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.2", Name: "dicomDevicesRoot", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.3", Name: "dicomUniqueAETitlesRegistryRoot", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.4", Name: "dicomDevice", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.5", Name: "dicomNetworkAE", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.6", Name: "dicomNetworkConnection", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.7", Name: "dicomUniqueAETitle", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.0.4.8", Name: "dicomTransferCapability", Type: TypeLDAPOID, Info: "", Retired: false},
+	{UID: "1.2.840.10008.15.1.1", Name: "Universal Coordinated Time", Type: TypeSynchronizationFrameOfReference, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.10", Name: "Dublin Core", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.11", Name: "New York University Melanoma Clinical Cooperative Group", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.12", Name: "Mayo Clinic Non-radiological Images Specific Body Structure Anatomical Surface Region Guide", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.13", Name: "Image Biomarker Standardization Initiative", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.14", Name: "Radiomics Ontology", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.15", Name: "RadElement", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.16", Name: "ICD-11", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.17", Name: "Unified numbering system (UNS) for metals and alloys", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.18", Name: "Research Resource Identification", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.4", Name: "DICOM Controlled Terminology", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.5", Name: "Adult Mouse Anatomy Ontology", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.6", Name: "Uberon Ontology", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.7", Name: "Integrated Taxonomic Information System (ITIS) Taxonomic Serial Number (TSN)", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.8", Name: "Mouse Genome Initiative (MGI)", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.16.9", Name: "PubChem Compound CID", Type: TypeCodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.2.6.1", Name: "DICOM UID Registry", Type: TypeDICOMUIDsAsACodingScheme, Info: "", Retired: false},
+	{UID: "1.2.840.10008.3.1.1.1", Name: "DICOM Application Context Name", Type: TypeApplicationContextName, Info: "", Retired: false},
+	{UID: "1.2.840.10008.3.1.2.1.1", Name: "Detached Patient Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.1.4", Name: "Detached Patient Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.2.1", Name: "Detached Visit Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.3.1", Name: "Detached Study Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.3.2", Name: "Study Component Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.3.3", Name: "Modality Performed Procedure Step SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.3.1.2.3.4", Name: "Modality Performed Procedure Step Retrieve SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.3.1.2.3.5", Name: "Modality Performed Procedure Step Notification SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.3.1.2.5.1", Name: "Detached Results Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.5.4", Name: "Detached Results Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.5.5", Name: "Detached Study Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.3.1.2.6.1", Name: "Detached Interpretation Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.4.2", Name: "Storage Service Class", Type: TypeServiceClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.1", Name: "Basic Film Session SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.14", Name: "Print Job SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.15", Name: "Basic Annotation Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.16", Name: "Printer SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.16.376", Name: "Printer Configuration Retrieval SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.17", Name: "Printer SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.17.376", Name: "Printer Configuration Retrieval SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.18", Name: "Basic Color Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.18.1", Name: "Referenced Color Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.2", Name: "Basic Film Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.22", Name: "VOI LUT Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.23", Name: "Presentation LUT SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.24", Name: "Image Overlay Box SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.24.1", Name: "Basic Print Image Overlay Box SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.25", Name: "Print Queue SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.26", Name: "Print Queue Management SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.27", Name: "Stored Print Storage SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.29", Name: "Hardcopy Grayscale Image Storage SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.30", Name: "Hardcopy Color Image Storage SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.31", Name: "Pull Print Request SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.32", Name: "Pull Stored Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.33", Name: "Media Creation Management SOP Class UID", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.4", Name: "Basic Grayscale Image Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.4.1", Name: "Basic Color Image Box SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.4.2", Name: "Referenced Image Box SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.1.40", Name: "Display System SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.40.1", Name: "Display System SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.9", Name: "Basic Grayscale Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.1.9.1", Name: "Referenced Grayscale Print Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.1", Name: "Computed Radiography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.1.1", Name: "Digital X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.1.1.1", Name: "Digital X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.1.2", Name: "Digital Mammography X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.1.2.1", Name: "Digital Mammography X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.1.3", Name: "Digital Intra-Oral X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.1.3.1", Name: "Digital Intra-Oral X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.10", Name: "Standalone Modality LUT Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.104.1", Name: "Encapsulated PDF Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.104.2", Name: "Encapsulated CDA Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.104.3", Name: "Encapsulated STL Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.104.4", Name: "Encapsulated OBJ Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.104.5", Name: "Encapsulated MTL Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11", Name: "Standalone VOI LUT Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.1", Name: "Grayscale Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.10", Name: "Segmented Volume Rendering Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.11", Name: "Multiple Volume Rendering Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.12", Name: "Variable Modality LUT Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.2", Name: "Color Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.3", Name: "Pseudo-Color Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.4", Name: "Blending Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.5", Name: "XA/XRF Grayscale Softcopy Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.6", Name: "Grayscale Planar MPR Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.7", Name: "Compositing Planar MPR Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.8", Name: "Advanced Blending Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.11.9", Name: "Volume Rendering Volumetric Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.12.1", Name: "X-Ray Angiographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.12.1.1", Name: "Enhanced XA Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.12.2", Name: "X-Ray Radiofluoroscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.12.2.1", Name: "Enhanced XRF Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.12.3", Name: "X-Ray Angiographic Bi-Plane Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.12.77", Name: "", Type: TypeSOPClass, Info: "(2015c)", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.128", Name: "Positron Emission Tomography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.128.1", Name: "Legacy Converted Enhanced PET Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.129", Name: "Standalone PET Curve Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.13.1.1", Name: "X-Ray 3D Angiographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.13.1.2", Name: "X-Ray 3D Craniofacial Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.13.1.3", Name: "Breast Tomosynthesis Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.13.1.4", Name: "Breast Projection X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.13.1.5", Name: "Breast Projection X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.130", Name: "Enhanced PET Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.131", Name: "Basic Structured Display Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.14.1", Name: "Intravascular Optical Coherence Tomography Image Storage - For Presentation", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.14.2", Name: "Intravascular Optical Coherence Tomography Image Storage - For Processing", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.2", Name: "CT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.2.1", Name: "Enhanced CT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.2.2", Name: "Legacy Converted Enhanced CT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.20", Name: "Nuclear Medicine Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.1", Name: "CT Defined Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.2", Name: "CT Performed Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.3", Name: "Protocol Approval Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.4", Name: "Protocol Approval Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.5", Name: "Protocol Approval Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.6", Name: "Protocol Approval Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.7", Name: "XA Defined Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.200.8", Name: "XA Performed Procedure Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.201.1", Name: "Inventory Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.201.1.1", Name: "Storage Management SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.201.2", Name: "Inventory - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.201.3", Name: "Inventory - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.201.4", Name: "Inventory - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.201.5", Name: "Inventory Creation", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.201.6", Name: "Repository Query", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.3", Name: "Ultrasound Multi-frame Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.3.1", Name: "Ultrasound Multi-frame Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.30", Name: "Parametric Map Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.4", Name: "MR Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.4.1", Name: "Enhanced MR Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.4.2", Name: "MR Spectroscopy Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.4.3", Name: "Enhanced MR Color Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.4.4", Name: "Legacy Converted Enhanced MR Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.40", Name: "", Type: TypeSOPClass, Info: "(2015c)", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.1", Name: "RT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.10", Name: "RT Physician Intent Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.11", Name: "RT Segment Annotation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.12", Name: "RT Radiation Set Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.13", Name: "C-Arm Photon-Electron Radiation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.14", Name: "Tomotherapeutic Radiation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.15", Name: "Robotic-Arm Radiation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.16", Name: "RT Radiation Record Set Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.17", Name: "RT Radiation Salvage Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.18", Name: "Tomotherapeutic Radiation Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.19", Name: "C-Arm Photon-Electron Radiation Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.2", Name: "RT Dose Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.20", Name: "Robotic Radiation Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.21", Name: "RT Radiation Set Delivery Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.22", Name: "RT Treatment Preparation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.23", Name: "Enhanced RT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.24", Name: "Enhanced Continuous RT Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.25", Name: "RT Patient Position Acquisition Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.3", Name: "RT Structure Set Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.4", Name: "RT Beams Treatment Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.5", Name: "RT Plan Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.6", Name: "RT Brachy Treatment Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.7", Name: "RT Treatment Summary Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.8", Name: "RT Ion Plan Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.481.9", Name: "RT Ion Beams Treatment Record Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.5", Name: "Nuclear Medicine Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.501.1", Name: "DICOS CT Image Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.501.2.1", Name: "DICOS Digital X-Ray Image Storage - For Presentation", Type: TypeSOPClass, Info: "DICOS", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.501.2.2", Name: "DICOS Digital X-Ray Image Storage - For Processing", Type: TypeSOPClass, Info: "DICOS", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.501.3", Name: "DICOS Threat Detection Report Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.501.4", Name: "DICOS 2D AIT Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.501.5", Name: "DICOS 3D AIT Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.501.6", Name: "DICOS Quadrupole Resonance (QR) Storage", Type: TypeSOPClass, Info: "DICOS", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.6", Name: "Ultrasound Image Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.6.1", Name: "Ultrasound Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.6.2", Name: "Enhanced US Volume Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.6.3", Name: "Photoacoustic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.601.1", Name: "Eddy Current Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E2934", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.601.2", Name: "Eddy Current Multi-frame Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E2934", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.601.3", Name: "Thermography Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E3440", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.601.4", Name: "Thermography Multi-frame Image Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E3440", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.601.5", Name: "Ultrasound Waveform Storage", Type: TypeSOPClass, Info: "DICONDE ASTM E2663", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66", Name: "Raw Data Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.1", Name: "Spatial Registration Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.2", Name: "Spatial Fiducials Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.3", Name: "Deformable Spatial Registration Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.4", Name: "Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.5", Name: "Surface Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.6", Name: "Tractography Results Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.7", Name: "Label Map Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.66.8", Name: "Height Map Segmentation Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.67", Name: "Real World Value Mapping Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.68.1", Name: "Surface Scan Mesh Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.68.2", Name: "Surface Scan Point Cloud Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.7", Name: "Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.7.1", Name: "Multi-frame Single Bit Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.7.2", Name: "Multi-frame Grayscale Byte Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.7.3", Name: "Multi-frame Grayscale Word Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.7.4", Name: "Multi-frame True Color Secondary Capture Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1", Name: "VL Image Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.1", Name: "VL Endoscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.1.1", Name: "Video Endoscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.2", Name: "VL Microscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.2.1", Name: "Video Microscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.3", Name: "VL Slide-Coordinates Microscopic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.4", Name: "VL Photographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.4.1", Name: "Video Photographic Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.1", Name: "Ophthalmic Photography 8 Bit Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.2", Name: "Ophthalmic Photography 16 Bit Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.3", Name: "Stereometric Relationship Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.4", Name: "Ophthalmic Tomography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.5", Name: "Wide Field Ophthalmic Photography Stereographic Projection Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.6", Name: "Wide Field Ophthalmic Photography 3D Coordinates Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.7", Name: "Ophthalmic Optical Coherence Tomography En Face Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.5.8", Name: "Ophthalmic Optical Coherence Tomography B-scan Volume Analysis Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.6", Name: "VL Whole Slide Microscopy Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.7", Name: "Dermoscopic Photography Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.8", Name: "Confocal Microscopy Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.1.9", Name: "Confocal Microscopy Tiled Pyramidal Image Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.77.2", Name: "VL Multi-frame Image Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.1", Name: "Lensometry Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.2", Name: "Autorefraction Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.3", Name: "Keratometry Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.4", Name: "Subjective Refraction Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.5", Name: "Visual Acuity Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.6", Name: "Spectacle Prescription Report Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.7", Name: "Ophthalmic Axial Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.78.8", Name: "Intraocular Lens Calculations Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.79.1", Name: "Macular Grid Thickness and Volume Report Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.8", Name: "Standalone Overlay Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.80.1", Name: "Ophthalmic Visual Field Static Perimetry Measurements Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.81.1", Name: "Ophthalmic Thickness Map Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.82.1", Name: "Corneal Topography Map Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.1", Name: "Text SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.11", Name: "Basic Text SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.2", Name: "Audio SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.22", Name: "Enhanced SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.3", Name: "Detail SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.33", Name: "Comprehensive SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.34", Name: "Comprehensive 3D SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.35", Name: "Extensible SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.4", Name: "Comprehensive SR Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.40", Name: "Procedure Log Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.50", Name: "Mammography CAD SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.59", Name: "Key Object Selection Document Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.65", Name: "Chest CAD SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.67", Name: "X-Ray Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.68", Name: "Radiopharmaceutical Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.69", Name: "Colon CAD SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.70", Name: "Implantation Plan SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.71", Name: "Acquisition Context SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.72", Name: "Simplified Adult Echo SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.73", Name: "Patient Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.74", Name: "Planned Imaging Agent Administration SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.75", Name: "Performed Imaging Agent Administration SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.76", Name: "Enhanced X-Ray Radiation Dose SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.88.77", Name: "Waveform Annotation SR Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9", Name: "Standalone Curve Storage", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.1", Name: "Waveform Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.1.1", Name: "12-lead ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.1.2", Name: "General ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.1.3", Name: "Ambulatory ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.1.4", Name: "General 32-bit ECG Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.100.1", Name: "Waveform Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.100.2", Name: "Waveform Acquisition Presentation State Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.2.1", Name: "Hemodynamic Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.3.1", Name: "Cardiac Electrophysiology Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.4.1", Name: "Basic Voice Audio Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.4.2", Name: "General Audio Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.5.1", Name: "Arterial Pulse Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.6.1", Name: "Respiratory Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.6.2", Name: "Multi-channel Respiratory Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.7.1", Name: "Routine Scalp Electroencephalogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.7.2", Name: "Electromyogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.7.3", Name: "Electrooculogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.7.4", Name: "Sleep Electroencephalogram Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.9.8.1", Name: "Body Position Waveform Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.90.1", Name: "Content Assessment Results Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.1.91.1", Name: "Microscopy Bulk Simple Annotations Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.1.1", Name: "Patient Root Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.1.2", Name: "Patient Root Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.1.3", Name: "Patient Root Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.2.1", Name: "Study Root Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.2.2", Name: "Study Root Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.2.3", Name: "Study Root Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.3.1", Name: "Patient/Study Only Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.2.3.2", Name: "Patient/Study Only Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.2.3.3", Name: "Patient/Study Only Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.1.2.4.2", Name: "Composite Instance Root Retrieve - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.4.3", Name: "Composite Instance Root Retrieve - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.1.2.5.3", Name: "Composite Instance Retrieve Without Bulk Data - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.20.1", Name: "Defined Procedure Protocol Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.20.2", Name: "Defined Procedure Protocol Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.20.3", Name: "Defined Procedure Protocol Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.31", Name: "Modality Worklist Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.32", Name: "General Purpose Worklist Management Meta SOP Class", Type: TypeMetaSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.32.1", Name: "General Purpose Worklist Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.32.2", Name: "General Purpose Scheduled Procedure Step SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.32.3", Name: "General Purpose Performed Procedure Step SOP Class", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.33", Name: "Instance Availability Notification SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.1", Name: "RT Beams Delivery Instruction Storage - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.10", Name: "RT Brachy Application Setup Delivery Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.2", Name: "RT Conventional Machine Verification - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.3", Name: "RT Ion Machine Verification - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.4", Name: "Unified Worklist and Procedure Step Service Class - Trial", Type: TypeServiceClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.4.1", Name: "Unified Procedure Step - Push SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.4.2", Name: "Unified Procedure Step - Watch SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.4.3", Name: "Unified Procedure Step - Pull SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.4.4", Name: "Unified Procedure Step - Event SOP Class - Trial", Type: TypeSOPClass, Info: "", Retired: true},
+	{UID: "1.2.840.10008.5.1.4.34.5", Name: "UPS Global Subscription SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.5.1", Name: "UPS Filtered Global Subscription SOP Instance", Type: TypeWellKnownSOPInstance, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.6", Name: "Unified Worklist and Procedure Step Service Class", Type: TypeServiceClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.6.1", Name: "Unified Procedure Step - Push SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.6.2", Name: "Unified Procedure Step - Watch SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.6.3", Name: "Unified Procedure Step - Pull SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.6.4", Name: "Unified Procedure Step - Event SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.6.5", Name: "Unified Procedure Step - Query SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.7", Name: "RT Beams Delivery Instruction Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.8", Name: "RT Conventional Machine Verification", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.34.9", Name: "RT Ion Machine Verification", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.37.1", Name: "General Relevant Patient Information Query", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.37.2", Name: "Breast Imaging Relevant Patient Information Query", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.37.3", Name: "Cardiac Relevant Patient Information Query", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.38.1", Name: "Hanging Protocol Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.38.2", Name: "Hanging Protocol Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.38.3", Name: "Hanging Protocol Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.38.4", Name: "Hanging Protocol Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.39.1", Name: "Color Palette Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.39.2", Name: "Color Palette Query/Retrieve Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.39.3", Name: "Color Palette Query/Retrieve Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.39.4", Name: "Color Palette Query/Retrieve Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.41", Name: "Product Characteristics Query SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.42", Name: "Substance Approval Query SOP Class", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.43.1", Name: "Generic Implant Template Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.43.2", Name: "Generic Implant Template Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.43.3", Name: "Generic Implant Template Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.43.4", Name: "Generic Implant Template Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.44.1", Name: "Implant Assembly Template Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.44.2", Name: "Implant Assembly Template Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.44.3", Name: "Implant Assembly Template Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.44.4", Name: "Implant Assembly Template Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.45.1", Name: "Implant Template Group Storage", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.45.2", Name: "Implant Template Group Information Model - FIND", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.45.3", Name: "Implant Template Group Information Model - MOVE", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.5.1.4.45.4", Name: "Implant Template Group Information Model - GET", Type: TypeSOPClass, Info: "", Retired: false},
+	{UID: "1.2.840.10008.7.1.1", Name: "Native DICOM Model", Type: TypeApplicationHostingModel, Info: "", Retired: false},
+	{UID: "1.2.840.10008.7.1.2", Name: "Abstract Multi-Dimensional Image Model", Type: TypeApplicationHostingModel, Info: "", Retired: false},
+	{UID: "1.2.840.10008.8.1.1", Name: "DICOM Content Mapping Resource", Type: TypeMappingResource, Info: "", Retired: false},
 }